@@ -1,23 +1,54 @@
 """
 Bato Bomber Sprite Generator
 Generates all game sprites with cyberpunk hacker theme
+
+Sheets are built in parallel worker processes, and a sheet is only
+rebuilt when its generator code or tile size changed since the last run
+(tracked in sprite_manifest.json next to this file).
+
+    python assets/sprites/sprite_generator.py
+    python assets/sprites/sprite_generator.py --tile-size 48 --tile-size 32
+    python assets/sprites/sprite_generator.py --force
 """
 
-import pygame
+import argparse
+import hashlib
+import inspect
+import json
 import os
+from concurrent.futures import ProcessPoolExecutor
 from PIL import Image, ImageDraw
 
+DEFAULT_TILE_SIZE = 48
+MANIFEST_FILE = "sprite_manifest.json"
+
+# Sheet file -> (generator, helpers whose code also feeds the sheet)
+SHEETS = {
+    "player_blue.png": ("generate_player_sheet", ("_draw_character",)),
+    "enemy_red.png": ("generate_enemy_sheet", ("_draw_character",)),
+    "bomb.png": ("generate_bomb_sheet", ()),
+    "explosion.png": ("generate_explosion_sheet", ()),
+    "powerups.png": ("generate_powerups_sheet", ()),
+    "tiles.png": ("generate_tiles_sheet", ()),
+}
+
 class SpriteGenerator:
     """Generate sprite sheets for Bato Bomber"""
     
-    TILE_SIZE = 48
-    SPRITE_DIR = "D:/Python Sample/PyGames/Bato_Bomber/assets/sprites"
+    TILE_SIZE = DEFAULT_TILE_SIZE
+    SPRITE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+    @staticmethod
+    def output_dir(tile_size):
+        """The game's sheets live in this folder; other tile sizes go in a subfolder"""
+        if tile_size == DEFAULT_TILE_SIZE:
+            return SpriteGenerator.SPRITE_DIR
+        return os.path.join(SpriteGenerator.SPRITE_DIR, str(tile_size))
     
     @staticmethod
-    def init_dir():
+    def init_dir(tile_size=DEFAULT_TILE_SIZE):
         """Create sprites directory if it doesn't exist"""
-        if not os.path.exists(SpriteGenerator.SPRITE_DIR):
-            os.makedirs(SpriteGenerator.SPRITE_DIR)
+        os.makedirs(SpriteGenerator.output_dir(tile_size), exist_ok=True)
     
     @staticmethod
     def _draw_character(draw, x, y, size, color, dark_color, accent_color, direction, step_phase=0):
@@ -83,7 +114,7 @@ class SpriteGenerator:
         dark = (50, 100, 200)
         accent = (200, 255, 100)
         
-        char_size = 24
+        char_size = SpriteGenerator.TILE_SIZE // 2
         offset = (SpriteGenerator.TILE_SIZE - char_size) // 2
 
         # Row 0: Idle (up, down, left, right)
@@ -111,8 +142,7 @@ class SpriteGenerator:
             # Arm raised
             draw.rectangle([x + char_size - 4, y - 4, x + char_size, y + 8], fill=skin, outline=dark)
         
-        img.save(f"{SpriteGenerator.SPRITE_DIR}/player_blue.png")
-        print(f"✓ Generated: player_blue.png ({width}x{height})")
+        return img
     
     @staticmethod
     def generate_enemy_sheet():
@@ -127,7 +157,7 @@ class SpriteGenerator:
         dark = (200, 50, 50)
         accent = (255, 200, 100)
         
-        char_size = 24
+        char_size = SpriteGenerator.TILE_SIZE // 2
         offset = (SpriteGenerator.TILE_SIZE - char_size) // 2
 
         # 2 walk frames per direction: Left Step -> Right Step
@@ -140,8 +170,7 @@ class SpriteGenerator:
                 y = row * SpriteGenerator.TILE_SIZE + offset
                 SpriteGenerator._draw_character(draw, x, y, char_size, skin, dark, accent, direction=col, step_phase=step_phase)
         
-        img.save(f"{SpriteGenerator.SPRITE_DIR}/enemy_red.png")
-        print(f"✓ Generated: enemy_red.png ({width}x{height})")
+        return img
     
     @staticmethod
     def generate_bomb_sheet():
@@ -155,7 +184,7 @@ class SpriteGenerator:
         bomb_color = (30, 30, 30)
         spark = (255, 255, 100)
         
-        bomb_size = 24
+        bomb_size = SpriteGenerator.TILE_SIZE // 2
         offset = (SpriteGenerator.TILE_SIZE - bomb_size) // 2
 
         for i in range(3):
@@ -166,8 +195,7 @@ class SpriteGenerator:
             spark_size = 4 + i * 2
             draw.ellipse([x + 8, y - 6 - spark_size, x + 16, y - 6], fill=spark)
         
-        img.save(f"{SpriteGenerator.SPRITE_DIR}/bomb.png")
-        print(f"✓ Generated: bomb.png ({width}x{height})")
+        return img
     
     @staticmethod
     def generate_explosion_sheet():
@@ -185,12 +213,11 @@ class SpriteGenerator:
         for frame in range(4):
             x = frame * SpriteGenerator.TILE_SIZE + center
             y = center
-            size = 8 + frame * 6  # Scaled size
+            size = (8 + frame * 6) * SpriteGenerator.TILE_SIZE // DEFAULT_TILE_SIZE  # Scaled size
             
             draw.ellipse([x - size, y - size, x + size, y + size], fill=colors[frame])
         
-        img.save(f"{SpriteGenerator.SPRITE_DIR}/explosion.png")
-        print(f"✓ Generated: explosion.png ({width}x{height})")
+        return img
     
     @staticmethod
     def generate_powerups_sheet():
@@ -201,7 +228,7 @@ class SpriteGenerator:
         img = Image.new('RGBA', (width, height), (0, 0, 0, 0))
         draw = ImageDraw.Draw(img)
         
-        item_size = 32
+        item_size = SpriteGenerator.TILE_SIZE * 2 // 3
         offset = (SpriteGenerator.TILE_SIZE - item_size) // 2
 
         # Power-up 0: Bomb Count (Gold)
@@ -219,8 +246,7 @@ class SpriteGenerator:
         draw.rectangle([x, y, x + item_size, y + item_size], fill=(100, 200, 255), outline=(50, 150, 200))
         draw.text((x + 12, y + 10), "S", fill=(0, 0, 0))
         
-        img.save(f"{SpriteGenerator.SPRITE_DIR}/powerups.png")
-        print(f"✓ Generated: powerups.png ({width}x{height})")
+        return img
     
     @staticmethod
     def generate_tiles_sheet():
@@ -233,6 +259,8 @@ class SpriteGenerator:
         
         ts = SpriteGenerator.TILE_SIZE
 
+        inset = ts // 8
+
         # Tile 0: Floor
         x = 0
         draw.rectangle([x, 0, x + ts, ts], fill=(220, 220, 220), outline=(180, 180, 180))
@@ -240,43 +268,95 @@ class SpriteGenerator:
         # Tile 1: Wall
         x = ts
         draw.rectangle([x, 0, x + ts, ts], fill=(80, 80, 80), outline=(60, 60, 60))
-        draw.rectangle([x + 6, 6, x + ts - 6, ts - 6], fill=(100, 100, 100))
+        draw.rectangle([x + inset, inset, x + ts - inset, ts - inset], fill=(100, 100, 100))
         
         # Tile 2: Destructible
         x = 2 * ts
         draw.rectangle([x, 0, x + ts, ts], fill=(180, 120, 60), outline=(150, 90, 40))
-        draw.rectangle([x + 6, 6, x + ts - 6, ts - 6], fill=(150, 100, 50))
+        draw.rectangle([x + inset, inset, x + ts - inset, ts - inset], fill=(150, 100, 50))
         
         # Tile 3: Home/Goal
         x = 3 * ts
         draw.rectangle([x, 0, x + ts, ts], fill=(100, 150, 255), outline=(50, 100, 200))
-        draw.line([x + 12, 12, x + ts - 12, ts - 12], fill=(200, 255, 100), width=3)
-        draw.circle((x + ts - 12, 24), 4, fill=(255, 200, 100))
+        draw.line([x + ts // 4, ts // 4, x + ts - ts // 4, ts - ts // 4], fill=(200, 255, 100), width=3)
+        draw.circle((x + ts - ts // 4, ts // 2), ts // 12, fill=(255, 200, 100))
         
-        img.save(f"{SpriteGenerator.SPRITE_DIR}/tiles.png")
-        print(f"✓ Generated: tiles.png ({width}x{height})")
+        return img
     
     @staticmethod
-    def generate_all():
-        """Generate all sprite sheets"""
+    def input_hash(sheet, tile_size):
+        """Hash of everything that determines a sheet: generator code and tile size"""
+        generator, helpers = SHEETS[sheet]
+        digest = hashlib.sha256(f"{sheet}:{tile_size}".encode("utf-8"))
+        for name in (generator,) + helpers:
+            digest.update(inspect.getsource(getattr(SpriteGenerator, name)).encode("utf-8"))
+        return digest.hexdigest()
+
+    @staticmethod
+    def load_manifest():
+        try:
+            with open(os.path.join(SpriteGenerator.SPRITE_DIR, MANIFEST_FILE), "r") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    @staticmethod
+    def save_manifest(manifest):
+        with open(os.path.join(SpriteGenerator.SPRITE_DIR, MANIFEST_FILE), "w") as f:
+            json.dump(manifest, f, indent=2, sort_keys=True)
+
+    @staticmethod
+    def generate_all(tile_sizes=(DEFAULT_TILE_SIZE,), force=False, jobs=None):
+        """Generate every sheet whose inputs changed, in parallel"""
         print("\n🎨 Generating Bato Bomber Sprites...")
-        SpriteGenerator.init_dir()
-        
-        SpriteGenerator.generate_player_sheet()
-        SpriteGenerator.generate_enemy_sheet()
-        SpriteGenerator.generate_bomb_sheet()
-        SpriteGenerator.generate_explosion_sheet()
-        SpriteGenerator.generate_powerups_sheet()
-        SpriteGenerator.generate_tiles_sheet()
-        
-        print("\n✅ All sprites generated in 'assets/sprites/' folder!")
-        print("\nSprite files created:")
-        print("  • player_blue.png     - Blue player character")
-        print("  • enemy_red.png       - Red enemy characters")
-        print("  • bomb.png            - Bomb animation")
-        print("  • explosion.png       - Explosion animation")
-        print("  • powerups.png        - Power-up items (B, R, S)")
-        print("  • tiles.png           - Tilemap (floor, wall, destructible, home)")
+        manifest = SpriteGenerator.load_manifest()
+
+        tasks = []
+        for tile_size in tile_sizes:
+            SpriteGenerator.init_dir(tile_size)
+            for sheet in SHEETS:
+                key = f"{tile_size}/{sheet}"
+                digest = SpriteGenerator.input_hash(sheet, tile_size)
+                path = os.path.join(SpriteGenerator.output_dir(tile_size), sheet)
+                if not force and manifest.get(key) == digest and os.path.exists(path):
+                    print(f"• Up to date: {key}")
+                    continue
+                tasks.append((key, digest, sheet, tile_size))
+
+        if not tasks:
+            print("\n✅ All sprites up to date.")
+            return
+
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            futures = [(key, digest, pool.submit(_build_sheet, sheet, tile_size))
+                       for key, digest, sheet, tile_size in tasks]
+            for key, digest, future in futures:
+                width, height = future.result()
+                manifest[key] = digest
+                print(f"✓ Generated: {key} ({width}x{height})")
+
+        SpriteGenerator.save_manifest(manifest)
+        print(f"\n✅ Generated {len(tasks)} sheet(s) in '{SpriteGenerator.SPRITE_DIR}'")
+
+
+def _build_sheet(sheet, tile_size):
+    """Worker process entry point: draw one sheet at one tile size and save it"""
+    SpriteGenerator.TILE_SIZE = tile_size
+    generator, _ = SHEETS[sheet]
+    img = getattr(SpriteGenerator, generator)()
+    img.save(os.path.join(SpriteGenerator.output_dir(tile_size), sheet))
+    return img.size
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the Bato Bomber sprite sheets")
+    parser.add_argument("--tile-size", type=int, action="append", dest="tile_sizes",
+                        help=f"tile size in pixels; repeat for several (default {DEFAULT_TILE_SIZE})")
+    parser.add_argument("--force", action="store_true", help="rebuild even if inputs are unchanged")
+    parser.add_argument("--jobs", type=int, help="worker processes (default: one per CPU)")
+    args = parser.parse_args()
+
+    SpriteGenerator.generate_all(tuple(args.tile_sizes or (DEFAULT_TILE_SIZE,)), args.force, args.jobs)
 
 if __name__ == "__main__":
-    SpriteGenerator.generate_all()
+    main()
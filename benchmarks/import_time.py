@@ -0,0 +1,78 @@
+"""
+Startup import-time report.
+
+Imports the game's entry module in a fresh interpreter with
+``-X importtime`` and reports the total and the slowest top-level packages
+as JSON, so launches can be compared across commits. Each module's own
+(self) time is charged to its top-level package, wherever it was imported
+from, so nested imports count towards e.g. pygame rather than main.
+
+    python -m benchmarks.import_time
+    python -m benchmarks.import_time --output imports.json --compare old.json
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+from typing import Dict
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def measure(module: str = "main") -> Dict[str, float]:
+    """Import time in ms per top-level package, from each module's self time"""
+    env = dict(os.environ, PYGAME_HIDE_SUPPORT_PROMPT="1")
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT, env=env, capture_output=True, text=True,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(proc.stderr.strip().splitlines()[-1])
+
+    packages: Dict[str, float] = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        self_us, _, name = line[len("import time:"):].split("|")
+        if not self_us.strip().isdigit():
+            continue  # header row
+        # Nested imports are indented; group every entry by its top-level package
+        top = name.strip().split(".")[0]
+        packages[top] = packages.get(top, 0.0) + int(self_us) / 1000.0
+    return packages
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Report startup import times")
+    parser.add_argument("--module", default="main")
+    parser.add_argument("--top", type=int, default=15)
+    parser.add_argument("--output", help="write JSON to this file instead of stdout")
+    parser.add_argument("--compare", help="earlier report to compare against")
+    args = parser.parse_args()
+
+    packages = measure(args.module)
+    slowest = sorted(packages.items(), key=lambda kv: kv[1], reverse=True)[:args.top]
+    report = {
+        "module": args.module,
+        "total_ms": round(sum(packages.values()), 3),
+        "qt_loaded": any(name.startswith("PyQt") for name in packages),
+        "packages": {name: round(ms, 3) for name, ms in slowest},
+    }
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+
+    if args.compare:
+        with open(args.compare) as f:
+            old = json.load(f)
+        print(f"total: {old['total_ms']:.1f} ms -> {report['total_ms']:.1f} ms", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
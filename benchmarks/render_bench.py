@@ -0,0 +1,225 @@
+"""
+Render benchmark on synthetic scenes.
+
+Builds GameState scenes with a fixed seed, renders each one for a number of
+frames on SDL's dummy video driver and reports frame-time percentiles as
+JSON. Menu screens are timed the same way. The level-complete, game-over
+and win screens are left out because they block in pygame.time.wait().
+
+    python -m benchmarks.render_bench --frames 2000 --output bench.json
+    python -m benchmarks.render_bench --compare bench.json
+"""
+
+import argparse
+import json
+import platform
+import random
+import subprocess
+import sys
+import time
+from typing import Callable, Dict, List
+
+import pygame
+
+from config.settings import GameConfig, GameSettings, TileType
+from core.game_logic import GameState
+from core.headless import HeadlessRenderer
+from core.profiler import FrameProfiler
+from gameplay.entities import Bomb, Explosion, Enemy
+
+
+def _empty_state() -> GameState:
+    """A level with only border and pillar walls and no entities"""
+    state = GameState(GameConfig(), level=1)
+    tiles = state.tilemap.tiles
+    for y in range(1, state.tilemap.height - 1):
+        for x in range(1, state.tilemap.width - 1):
+            if tiles[y][x] == TileType.DESTRUCTIBLE:
+                tiles[y][x] = TileType.FLOOR
+    state.bombs.clear()
+    state.explosions.clear()
+    state.enemies.clear()
+    state.power_ups.clear()
+    return state
+
+
+def _floor_tiles(state: GameState) -> List[tuple]:
+    tilemap = state.tilemap
+    return [(x, y) for y in range(tilemap.height) for x in range(tilemap.width)
+            if tilemap.is_walkable(x, y)]
+
+
+def scene_empty() -> GameState:
+    return _empty_state()
+
+
+def scene_bombs() -> GameState:
+    state = _empty_state()
+    floor = _floor_tiles(state)
+    for i in range(50):
+        x, y = floor[i % len(floor)]
+        state.bombs.append(Bomb(grid_x=x, grid_y=y, pixel_x=0.0, pixel_y=0.0, timer=3.0))
+    return state
+
+
+def scene_explosions() -> GameState:
+    state = _empty_state()
+    floor = _floor_tiles(state)
+    for i in range(500):
+        x, y = floor[i % len(floor)]
+        state.explosions.append(Explosion(grid_x=x, grid_y=y, pixel_x=0.0, pixel_y=0.0))
+    return state
+
+
+def scene_enemies() -> GameState:
+    state = _empty_state()
+    floor = _floor_tiles(state)
+    for i in range(200):
+        x, y = floor[i % len(floor)]
+        state.enemies.append(Enemy(grid_x=x, grid_y=y, pixel_x=0.0, pixel_y=0.0))
+    return state
+
+
+def scene_full_hud() -> GameState:
+    state = GameState(GameConfig(), level=GameConfig.MAX_LEVELS)
+    state.score = 9999999
+    state.player.max_bombs = 99
+    state.player.bomb_count = 99
+    return state
+
+
+SCENES: Dict[str, Callable[[], GameState]] = {
+    "empty_map": scene_empty,
+    "bombs_50": scene_bombs,
+    "explosions_500": scene_explosions,
+    "enemies_200": scene_enemies,
+    "full_hud": scene_full_hud,
+}
+
+
+def _menus(renderer: HeadlessRenderer) -> Dict[str, Callable[[], None]]:
+    settings = GameSettings()
+    return {
+        "menu_main": lambda: renderer.render_main_menu(0),
+        "menu_options": lambda: renderer.render_options_menu(settings, 0),
+        "menu_difficulty": lambda: renderer.render_difficulty_menu(0),
+        "menu_credits": renderer.render_credits,
+        "menu_leaderboard": renderer.render_leaderboard,
+        "menu_name_input": lambda: renderer.render_name_input("PLAYER"),
+        "menu_pause": renderer.render_pause_screen,
+    }
+
+
+def _percentile(sorted_samples: List[float], pct: float) -> float:
+    index = min(len(sorted_samples) - 1, int(round(pct / 100.0 * (len(sorted_samples) - 1))))
+    return sorted_samples[index]
+
+
+def _summarize(samples: List[float]) -> Dict[str, float]:
+    ordered = sorted(samples)
+    return {
+        "frames": len(samples),
+        "mean_ms": sum(samples) / len(samples) * 1000.0,
+        "p50_ms": _percentile(ordered, 50) * 1000.0,
+        "p95_ms": _percentile(ordered, 95) * 1000.0,
+        "p99_ms": _percentile(ordered, 99) * 1000.0,
+        "max_ms": ordered[-1] * 1000.0,
+    }
+
+
+def _time(fn: Callable[[], None], frames: int, warmup: int) -> Dict[str, float]:
+    for _ in range(warmup):
+        fn()
+    samples = []
+    for _ in range(frames):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return _summarize(samples)
+
+
+def _git_commit() -> str:
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"], stderr=subprocess.DEVNULL, text=True
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+
+
+def _render_frame(renderer: HeadlessRenderer, state: GameState, dt: float):
+    renderer.render(state, dt)
+    if renderer.profiler is not None:
+        # As the game loop does, so the overlay shows a real history and
+        # the section timings don't pile up across frames
+        renderer.profiler.end_frame()
+
+
+def run(frames: int, warmup: int, seed: int) -> dict:
+    renderer = HeadlessRenderer()
+    dt = 1.0 / GameConfig.FPS
+    results = {}
+
+    for name, build in SCENES.items():
+        random.seed(seed)
+        state = build()
+        if name == "full_hud":
+            renderer.profiler = FrameProfiler()
+            renderer.show_perf_overlay = True
+        results[name] = _time(lambda: _render_frame(renderer, state, dt), frames, warmup)
+        renderer.profiler = None
+        renderer.show_perf_overlay = False
+
+    for name, draw in _menus(renderer).items():
+        results[name] = _time(draw, frames, warmup)
+
+    return {
+        "meta": {
+            "commit": _git_commit(),
+            "frames": frames,
+            "warmup": warmup,
+            "seed": seed,
+            "python": platform.python_version(),
+            "pygame": pygame.version.ver,
+            "platform": platform.platform(),
+        },
+        "results": results,
+    }
+
+
+def compare(current: dict, baseline: dict):
+    """Print p50/p95/p99 ratios against a baseline run (below 1.0 is faster)"""
+    print(f"{'benchmark':<20} {'p50':>8} {'p95':>8} {'p99':>8}")
+    for name, stats in current["results"].items():
+        base = baseline["results"].get(name)
+        if not base:
+            continue
+        ratios = [stats[k] / base[k] if base[k] else 0.0 for k in ("p50_ms", "p95_ms", "p99_ms")]
+        print(f"{name:<20} " + " ".join(f"{r:>8.2f}" for r in ratios))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark GameRenderer on synthetic scenes")
+    parser.add_argument("--frames", type=int, default=2000)
+    parser.add_argument("--warmup", type=int, default=100)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="write JSON results to this file instead of stdout")
+    parser.add_argument("--compare", help="baseline JSON file to compare against")
+    args = parser.parse_args()
+
+    report = run(args.frames, args.warmup, args.seed)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+
+    if args.compare:
+        with open(args.compare) as f:
+            compare(report, json.load(f))
+
+
+if __name__ == "__main__":
+    main()
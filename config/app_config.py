@@ -1,14 +1,13 @@
 import pygame
 import os
 import sys
-from PyQt5.QtCore import QFile
-from io import BytesIO
-import resources.resources_rc
-_ = resources.resources_rc
+from config.audio import MixerConfig
+from config.settings import GameConfig
+from resources import loader
 
 APP_NAME = "Bato Bomber"
-SCREEN_WIDTH = 416
-SCREEN_HEIGHT = 416
+SCREEN_WIDTH = GameConfig.WINDOW_WIDTH
+SCREEN_HEIGHT = GameConfig.WINDOW_HEIGHT
 
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 
@@ -24,12 +23,12 @@ def resource_path(relative):
 
 def load_icon(qrc_path, fallback_path, size=(32, 32)):
     try:
-        file = QFile(qrc_path)
-        if file.open(QFile.ReadOnly):
-            data = bytes(file.readAll())
-            file.close()
-            icon = pygame.image.load(BytesIO(data)).convert_alpha()
-            return pygame.transform.smoothscale(icon, size)
+        asset_pack = loader.packed(qrc_path)
+        if asset_pack is not None:
+            icon = asset_pack.load_image(loader.pack_name(qrc_path)).convert_alpha()
+        else:
+            icon = pygame.image.load(loader.resolve(qrc_path)).convert_alpha()
+        return pygame.transform.smoothscale(icon, size)
     except Exception:
         pass
 
@@ -41,7 +40,8 @@ def load_icon(qrc_path, fallback_path, size=(32, 32)):
 
 
 def setup_pygame():
-    pygame.mixer.init()
+    # Open the mixer once, with this machine's calibrated buffer size
+    MixerConfig.load().pre_init()
     pygame.init()
 
     screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
@@ -0,0 +1,162 @@
+"""
+Mixer configuration and latency calibration.
+
+The mixer is configured with pygame.mixer.pre_init before pygame.init, so
+it opens once with the chosen buffer size. Calibration measures, for each
+candidate buffer size, how long a play takes to be picked up and finished
+by the mixer, and records the best stable setting for this machine.
+
+    python -m config.audio --calibrate
+    python -m config.audio --buffer 256 --frequency 48000 --channels 2
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import time
+from dataclasses import dataclass, asdict
+from typing import Dict, List, Optional
+
+import pygame
+
+from core.paths import project_root
+
+CALIBRATION_FILE = os.path.join(project_root(), "data", "audio_calibration.json")
+BUFFER_SIZES = (128, 256, 512, 1024, 2048)
+PROBE_SECONDS = 0.05   # Length of the silent probe sound
+TRIALS = 12
+MAX_JITTER_MS = 5.0    # A buffer size whose latency varies more than this is starving
+
+
+@dataclass
+class MixerConfig:
+    """Mixer settings passed to pygame.mixer.pre_init"""
+    frequency: int = 44100
+    size: int = -16
+    channels: int = 2
+    buffer: int = 512
+    latency_ms: Optional[float] = None  # Measured by calibrate(), if it ran
+
+    def pre_init(self):
+        pygame.mixer.pre_init(self.frequency, self.size, self.channels, self.buffer)
+
+    @staticmethod
+    def machine() -> str:
+        return platform.node() or "default"
+
+    @staticmethod
+    def _read_all() -> Dict[str, dict]:
+        try:
+            with open(CALIBRATION_FILE, "r") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    @staticmethod
+    def load() -> "MixerConfig":
+        """Settings recorded for this machine, or the defaults"""
+        data = MixerConfig._read_all().get(MixerConfig.machine())
+        if not data:
+            return MixerConfig()
+        try:
+            return MixerConfig(**data)
+        except TypeError:
+            return MixerConfig()
+
+    def save(self):
+        """Record these settings for this machine"""
+        data = MixerConfig._read_all()
+        data[MixerConfig.machine()] = asdict(self)
+        try:
+            os.makedirs(os.path.dirname(CALIBRATION_FILE), exist_ok=True)
+            with open(CALIBRATION_FILE, "w") as f:
+                json.dump(data, f, indent=2)
+        except OSError as e:
+            print(f"Warning: Could not save audio calibration: {e}")
+
+
+def measure_latency(trials: int = TRIALS) -> List[float]:
+    """Delay in ms between starting a play and the mixer finishing it, beyond its length.
+
+    A channel only starts and stops on mixer callbacks, so this overhead is
+    what the buffer size adds between play_sfx and the sound being heard.
+    The probe goes through a VoiceManager laid out like the game's, so it
+    pays the same channel allocation as a real effect.
+    """
+    from core.sound import SFX_CATEGORIES
+    from core.voices import VoiceManager, VoicePolicy
+
+    frequency, size, channels = pygame.mixer.get_init()
+    frame_bytes = abs(size) // 8 * channels
+    silence = bytes(int(frequency * PROBE_SECONDS) * frame_bytes)
+    probe = pygame.mixer.Sound(buffer=silence)
+    policy = VoicePolicy("gameplay", max_voices=1, priority=0)
+    voices = VoiceManager(SFX_CATEGORIES, {"probe": policy}, dedupe_window=0.0)
+
+    samples = []
+    for _ in range(trials):
+        start = time.perf_counter()
+        channel = voices.play("probe", probe)
+        while channel.get_busy():
+            time.sleep(0.0005)
+        samples.append((time.perf_counter() - start - PROBE_SECONDS) * 1000.0)
+    voices.stop()
+    return samples
+
+
+def calibrate(base: Optional[MixerConfig] = None, buffer_sizes=BUFFER_SIZES) -> MixerConfig:
+    """Try each buffer size and return the lowest-latency one that stays stable"""
+    base = base or MixerConfig.load()
+    best = None
+    for buffer in buffer_sizes:
+        candidate = MixerConfig(base.frequency, base.size, base.channels, buffer)
+        pygame.mixer.quit()
+        try:
+            pygame.mixer.init(candidate.frequency, candidate.size, candidate.channels, buffer)
+        except pygame.error as e:
+            print(f"buffer {buffer:5d}: unavailable ({e})")
+            continue
+
+        samples = sorted(measure_latency())
+        median = statistics.median(samples)
+        p95 = samples[min(len(samples) - 1, int(len(samples) * 0.95))]
+        stable = p95 - median <= MAX_JITTER_MS
+        print(f"buffer {buffer:5d}: median {median:6.1f} ms, p95 {p95:6.1f} ms"
+              f"{'' if stable else '  (unstable)'}")
+        if stable and (best is None or p95 < best.latency_ms):
+            candidate.latency_ms = round(p95, 1)
+            best = candidate
+
+    pygame.mixer.quit()
+    return best or base
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Configure and calibrate the audio mixer")
+    parser.add_argument("--calibrate", action="store_true",
+                        help="measure each buffer size and keep the best for this machine")
+    parser.add_argument("--buffer", type=int, help="mixer buffer size in samples")
+    parser.add_argument("--frequency", type=int, help="mixer frequency in Hz")
+    parser.add_argument("--channels", type=int, choices=(1, 2), help="mono or stereo output")
+    args = parser.parse_args()
+
+    config = MixerConfig.load()
+    if args.frequency:
+        config.frequency = args.frequency
+    if args.channels:
+        config.channels = args.channels
+    if args.buffer:
+        config.buffer = args.buffer
+        config.latency_ms = None
+
+    if args.calibrate:
+        config = calibrate(config)
+
+    config.save()
+    print(f"{MixerConfig.machine()}: {asdict(config)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -47,18 +47,30 @@ class GameSettings:
     sfx_volume: float = 0.8
     screen_shake: bool = True
     
-    def save(self):
-        """Save settings to file"""
+    def to_json(self) -> str:
+        return json.dumps({
+            "difficulty": self.difficulty.name,
+            "music_volume": self.music_volume,
+            "sfx_volume": self.sfx_volume,
+            "screen_shake": self.screen_shake
+        })
+
+    @staticmethod
+    def write(settings_json: str):
+        """Encrypt and write settings; raises on failure"""
+        encrypted_settings = encrypt_data(settings_json)
+        with open("settings.json", "wb") as f:
+            f.write(encrypted_settings)
+
+    def save(self, writer=None):
+        """Save settings to file, on a core.persistence.PersistenceWorker if given"""
+        settings_json = self.to_json()  # Snapshot now; later changes queue their own save
+        if writer is not None:
+            # Keyed, so only the latest queued settings are written
+            writer.submit(lambda: GameSettings.write(settings_json), key="settings")
+            return
         try:
-            settings_json = json.dumps({
-                "difficulty": self.difficulty.name,
-                "music_volume": self.music_volume,
-                "sfx_volume": self.sfx_volume,
-                "screen_shake": self.screen_shake
-            })
-            encrypted_settings = encrypt_data(settings_json)
-            with open("settings.json", "wb") as f:
-                f.write(encrypted_settings)
+            GameSettings.write(settings_json)
         except:
             pass
     
@@ -81,11 +93,17 @@ class GameSettings:
 
 class GameConfig:
     GRID_SIZE = 13
+    GRID_WIDTH = GRID_SIZE   # Map size in tiles; may be larger than the viewport
+    GRID_HEIGHT = GRID_SIZE
+    VIEWPORT_TILES = 13      # Tiles visible across the window; the camera scrolls the rest
     TILE_WIDTH = 48  # Changed from 32 to 48
     TILE_HEIGHT = 48 # Changed from 32 to 48
-    WINDOW_WIDTH = 624 # Changed from 416 to 624 (13 * 48)
-    WINDOW_HEIGHT = 624 # Changed from 416 to 624 (13 * 48)
+    WINDOW_WIDTH = VIEWPORT_TILES * TILE_WIDTH    # 624 with 13 tiles of 48
+    WINDOW_HEIGHT = VIEWPORT_TILES * TILE_HEIGHT
     FPS = 60
+    THREADED_SIMULATION = False  # Run GameState.update on its own thread at SIMULATION_RATE
+    SIMULATION_RATE = 60
+    SQLITE_SCORES = False  # Keep every score in data/scores.db (gameplay.score_store) for tournaments
     ANIMATION_FPS = 8
     MOVE_SPEED = 4.0
     BOMB_TIMER = 3.0
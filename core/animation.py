@@ -2,9 +2,13 @@ from dataclasses import dataclass
 from typing import List, Dict, Optional, Tuple
 import pygame
 import os
-import sys
 
 from config.settings import GameConfig
+from core.atlas import SpriteAtlas, SHEET_FILES, PLAYER, BOMB, EXPLOSION, ENEMY
+from core.paths import base_path
+from core.pixel_cache import PixelCache
+from resources import loader
+from resources.pack import ViewReader
 
 
 @dataclass
@@ -76,29 +80,95 @@ class AnimationController:
 
 class SpriteFactory:
     sprite_cache = {}
+    missing_sprites = set()
+    pixel_cache_keys: Dict[str, str] = {}  # Decoded but not yet stored in the pixel cache
     sprites_loaded = False
+    atlas: Optional[SpriteAtlas] = None
 
     @staticmethod
-    def _get_base_path():
-        if getattr(sys, "frozen", False):
-            return sys._MEIPASS
-        return os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    def cache_name(filename: str, size: Optional[Tuple[int, int]] = None) -> str:
+        """sprite_cache key for a sprite, scaled to size if given"""
+        return filename if size is None else f"{filename}@{size[0]}x{size[1]}"
 
     @staticmethod
-    def load_sprite(filename: str) -> Optional[pygame.Surface]:
-        """Load sprite from file with caching"""
-        if filename in SpriteFactory.sprite_cache:
-            return SpriteFactory.sprite_cache[filename]
+    def _read_source(filename: str):
+        asset_pack = loader.packed("sprites/" + filename)
+        if asset_pack is not None:
+            return asset_pack.view("sprites/" + filename)
+        with open(os.path.join(base_path(), "assets", "sprites", filename), "rb") as f:
+            return f.read()
+
+    @staticmethod
+    def decode_sprite(filename: str, size: Optional[Tuple[int, int]] = None) -> Optional[pygame.Surface]:
+        """Decode (and scale) a sprite file; safe to call from worker threads.
 
+        Comes straight from the pixel cache, already in display format, when
+        this source was converted at this size before.
+        """
+        name = SpriteFactory.cache_name(filename, size)
         try:
-            base_path = SpriteFactory._get_base_path()
-            sprite_path = os.path.join(base_path, "assets", "sprites", filename)
-            sprite = pygame.image.load(sprite_path).convert_alpha()
-            SpriteFactory.sprite_cache[filename] = sprite
-            return sprite
-        except Exception:
-            # Silently fail if sprites don't exist yet
+            source = SpriteFactory._read_source(filename)
+            key = PixelCache.key(source, size)
+            if key is not None:
+                cached = PixelCache.load(key)
+                if cached is not None:
+                    return cached
+                SpriteFactory.pixel_cache_keys[name] = key
+            sprite = pygame.image.load(ViewReader(memoryview(source)), filename)
+        except (OSError, pygame.error):
+            # Remember the miss so it isn't retried from disk every frame
+            SpriteFactory.missing_sprites.add(name)
+            return None
+        if size is not None:
+            sprite = pygame.transform.scale(sprite, size)
+        return sprite
+
+    @staticmethod
+    def store_sprite(filename: str, sprite: Optional[pygame.Surface],
+                     size: Optional[Tuple[int, int]] = None) -> Optional[pygame.Surface]:
+        """Convert a decoded sprite for the display and cache it"""
+        if sprite is None:
             return None
+        name = SpriteFactory.cache_name(filename, size)
+        if not PixelCache.is_display_format(sprite):
+            try:
+                sprite = sprite.convert_alpha()
+            except pygame.error:
+                # No display mode yet; try again on the next call
+                return None
+            key = SpriteFactory.pixel_cache_keys.pop(name, None)
+            if key is not None:
+                PixelCache.store(key, sprite)
+        SpriteFactory.sprite_cache[name] = sprite
+        return sprite
+
+    @staticmethod
+    def load_sprite(filename: str, size: Optional[Tuple[int, int]] = None) -> Optional[pygame.Surface]:
+        """Load sprite from file with caching"""
+        name = SpriteFactory.cache_name(filename, size)
+        if name in SpriteFactory.sprite_cache:
+            return SpriteFactory.sprite_cache[name]
+        if name in SpriteFactory.missing_sprites:
+            return None
+        return SpriteFactory.store_sprite(filename, SpriteFactory.decode_sprite(filename, size), size)
+
+    @staticmethod
+    def get_atlas() -> SpriteAtlas:
+        """Return the sprite atlas, building it on first use"""
+        if SpriteFactory.atlas is not None:
+            return SpriteFactory.atlas
+
+        sheets = {}
+        for sheet_id, filename in enumerate(SHEET_FILES):
+            sprite = SpriteFactory.load_sprite(filename)
+            if sprite is not None:
+                sheets[sheet_id] = sprite
+
+        atlas = SpriteAtlas(sheets, GameConfig.TILE_WIDTH)
+        # Only keep the atlas once a display exists, or the sheets could not convert
+        if pygame.display.get_surface() is not None:
+            SpriteFactory.atlas = atlas
+        return atlas
 
     @staticmethod
     def create_player_animations(tile_size: int = None) -> AnimationController:
@@ -108,9 +178,9 @@ class SpriteFactory:
 
         controller = AnimationController()
         fs = 1.0 / GameConfig.ANIMATION_FPS
-        sprite = SpriteFactory.load_sprite("player_blue.png")
+        atlas = SpriteFactory.get_atlas()
 
-        if sprite is None:
+        if not atlas.has(PLAYER):
             # Create dummy animations if sprite not loaded
             dummy_frame = AnimationFrame(pygame.Rect(0, 0, tile_size, tile_size), fs)
             for i in range(4):
@@ -125,24 +195,21 @@ class SpriteFactory:
         for i in range(4):
             controller.add_animation(
                 f"idle_{i}",
-                SpriteAnimation([AnimationFrame(
-                    pygame.Rect(i * tile_size, 0, tile_size, tile_size),
-                    fs * 2
-                )], loop=True)
+                SpriteAnimation([AnimationFrame(atlas.cell(PLAYER, i, 0), fs * 2)], loop=True)
             )
 
         # Walk animations (rows 1-4, 4 frames each direction)
         for i in range(4):
             walk_frames = [
-                AnimationFrame(pygame.Rect(i * tile_size, (1 + j) * tile_size, tile_size, tile_size), fs)
+                AnimationFrame(atlas.cell(PLAYER, i, 1 + j), fs)
                 for j in range(4)
             ]
             controller.add_animation(f"walk_{i}", SpriteAnimation(walk_frames, loop=True))
 
         # Place bomb animations (row 5, 2 frames)
         place_frames = [
-            AnimationFrame(pygame.Rect(0, 5 * tile_size, tile_size, tile_size), fs),
-            AnimationFrame(pygame.Rect(tile_size, 5 * tile_size, tile_size, tile_size), fs * 0.5),
+            AnimationFrame(atlas.cell(PLAYER, 0, 5), fs),
+            AnimationFrame(atlas.cell(PLAYER, 1, 5), fs * 0.5),
         ]
         controller.add_animation("placing_bomb", SpriteAnimation(place_frames, loop=False))
 
@@ -157,18 +224,15 @@ class SpriteFactory:
 
         controller = AnimationController()
         fs = 1.0 / GameConfig.ANIMATION_FPS
-        sprite = SpriteFactory.load_sprite("bomb.png")
+        atlas = SpriteFactory.get_atlas()
 
-        if sprite is None:
+        if not atlas.has(BOMB):
             dummy_frame = AnimationFrame(pygame.Rect(0, 0, tile_size, tile_size), fs)
             controller.add_animation("active", SpriteAnimation([dummy_frame], loop=True))
             controller.set_state("active")
             return controller
 
-        frames = [
-            AnimationFrame(pygame.Rect(i * tile_size, 0, tile_size, tile_size), fs)
-            for i in range(3)
-        ]
+        frames = [AnimationFrame(atlas.cell(BOMB, i, 0), fs) for i in range(3)]
         controller.add_animation("active", SpriteAnimation(frames, loop=True))
         controller.set_state("active")
         return controller
@@ -181,18 +245,15 @@ class SpriteFactory:
 
         controller = AnimationController()
         fs = 1.0 / (GameConfig.ANIMATION_FPS * 2)
-        sprite = SpriteFactory.load_sprite("explosion.png")
+        atlas = SpriteFactory.get_atlas()
 
-        if sprite is None:
+        if not atlas.has(EXPLOSION):
             dummy_frame = AnimationFrame(pygame.Rect(0, 0, tile_size, tile_size), fs)
             controller.add_animation("burst", SpriteAnimation([dummy_frame], loop=False))
             controller.set_state("burst")
             return controller
 
-        frames = [
-            AnimationFrame(pygame.Rect(i * tile_size, 0, tile_size, tile_size), fs)
-            for i in range(4)
-        ]
+        frames = [AnimationFrame(atlas.cell(EXPLOSION, i, 0), fs) for i in range(4)]
         controller.add_animation("burst", SpriteAnimation(frames, loop=False))
         controller.set_state("burst")
         return controller
@@ -205,9 +266,9 @@ class SpriteFactory:
 
         controller = AnimationController()
         fs = 1.0 / GameConfig.ANIMATION_FPS
-        sprite = SpriteFactory.load_sprite("enemy_red.png")
+        atlas = SpriteFactory.get_atlas()
 
-        if sprite is None:
+        if not atlas.has(ENEMY):
             dummy_frame = AnimationFrame(pygame.Rect(0, 0, tile_size, tile_size), fs)
             for i in range(4):
                 controller.add_animation(f"walk_{i}", SpriteAnimation([dummy_frame], loop=True))
@@ -217,7 +278,7 @@ class SpriteFactory:
         # 4 directions, 2 frames each
         for i in range(4):
             walk_frames = [
-                AnimationFrame(pygame.Rect(i * tile_size, j * tile_size, tile_size, tile_size), fs)
+                AnimationFrame(atlas.cell(ENEMY, i, j), fs)
                 for j in range(2)
             ]
             controller.add_animation(f"walk_{i}", SpriteAnimation(walk_frames, loop=True))
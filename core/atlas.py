@@ -0,0 +1,72 @@
+from typing import Dict, List, Optional, Tuple
+import pygame
+
+
+# Sheet ids, used as indices into SpriteAtlas.frames
+TILES = 0
+PLAYER = 1
+BOMB = 2
+EXPLOSION = 3
+POWERUPS = 4
+ENEMY = 5
+
+SHEET_FILES = (
+    "tiles.png",
+    "player_blue.png",
+    "bomb.png",
+    "explosion.png",
+    "powerups.png",
+    "enemy_red.png",
+)
+
+
+class SpriteAtlas:
+    """All sprite sheets packed into one converted surface.
+
+    Every sheet is a grid of tile_size cells. Each sheet gets its own shelf
+    in the atlas and a tuple of precomputed source rects, indexed by
+    row * columns + col, so a per-frame lookup is plain indexing:
+    ``atlas.frames[TILES][2]``.
+    """
+
+    def __init__(self, sheets: Dict[int, pygame.Surface], tile_size: int):
+        self.tile_size = tile_size
+        self.surface: Optional[pygame.Surface] = None
+        self.origins: List[Optional[Tuple[int, int]]] = [None] * len(SHEET_FILES)
+        self.columns: List[int] = [0] * len(SHEET_FILES)
+        self.frames: List[Tuple[pygame.Rect, ...]] = [()] * len(SHEET_FILES)
+        self._pack(sheets)
+
+    def _pack(self, sheets: Dict[int, pygame.Surface]):
+        if not sheets:
+            return
+
+        ts = self.tile_size
+        width = max(sheet.get_width() for sheet in sheets.values())
+        height = sum(sheet.get_height() for sheet in sheets.values())
+        self.surface = pygame.Surface((width, height), pygame.SRCALPHA).convert_alpha()
+        self.surface.fill((0, 0, 0, 0))
+
+        y = 0
+        for sheet_id in sorted(sheets):
+            sheet = sheets[sheet_id]
+            # MAX onto a cleared area copies pixels and alpha unchanged
+            self.surface.blit(sheet, (0, y), special_flags=pygame.BLEND_RGBA_MAX)
+
+            cols = sheet.get_width() // ts
+            rows = sheet.get_height() // ts
+            self.origins[sheet_id] = (0, y)
+            self.columns[sheet_id] = cols
+            self.frames[sheet_id] = tuple(
+                pygame.Rect(col * ts, y + row * ts, ts, ts)
+                for row in range(rows)
+                for col in range(cols)
+            )
+            y += sheet.get_height()
+
+    def has(self, sheet_id: int) -> bool:
+        return bool(self.frames[sheet_id])
+
+    def cell(self, sheet_id: int, col: int, row: int) -> pygame.Rect:
+        """Source rect of a sheet cell, in atlas coordinates"""
+        return self.frames[sheet_id][row * self.columns[sheet_id] + col]
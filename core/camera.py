@@ -0,0 +1,49 @@
+from typing import Tuple
+
+import pygame
+
+
+class Camera:
+    """Window-sized view onto the map, in map pixel coordinates.
+
+    The camera centres on its target and is clamped to the map edges, so a
+    map no larger than the window stays anchored at (0, 0) as before.
+    """
+
+    def __init__(self, width: int, height: int, tile_size: int):
+        self.width = width
+        self.height = height
+        self.tile_size = tile_size
+        self.x = 0
+        self.y = 0
+
+    def follow(self, target_x: float, target_y: float, map_width: int, map_height: int):
+        """Centre on a pixel position; map size is given in tiles"""
+        max_x = map_width * self.tile_size - self.width
+        max_y = map_height * self.tile_size - self.height
+        self.x = max(0, min(int(target_x) - self.width // 2, max_x))
+        self.y = max(0, min(int(target_y) - self.height // 2, max_y))
+
+    def visible_tiles(self, map_width: int, map_height: int) -> Tuple[int, int, int, int]:
+        """Tile range (x0, y0, x1, y1) overlapping the view, end-exclusive"""
+        ts = self.tile_size
+        x0 = max(0, self.x // ts)
+        y0 = max(0, self.y // ts)
+        x1 = min(map_width, (self.x + self.width + ts - 1) // ts)
+        y1 = min(map_height, (self.y + self.height + ts - 1) // ts)
+        return x0, y0, x1, y1
+
+    def follow_sprite(self, pixel_x: int, pixel_y: int, map_width: int, map_height: int):
+        """Centre on the middle of a tile-sized sprite at a map position"""
+        half = self.tile_size // 2
+        self.follow(pixel_x + half, pixel_y + half, map_width, map_height)
+
+    def visible_rect(self) -> pygame.Rect:
+        """Sprite positions that pass is_visible, as a map pixel rect"""
+        ts = self.tile_size
+        return pygame.Rect(self.x - ts + 1, self.y - ts + 1, self.width + ts - 1, self.height + ts - 1)
+
+    def is_visible(self, pixel_x: float, pixel_y: float) -> bool:
+        """True if a tile-sized sprite at this map position overlaps the view"""
+        return (self.x - self.tile_size < pixel_x < self.x + self.width and
+                self.y - self.tile_size < pixel_y < self.y + self.height)
@@ -0,0 +1,109 @@
+import io
+import json
+import logging
+import os
+from typing import Dict, Optional, Tuple
+
+import pygame
+
+from core.paths import base_path, project_root
+
+FONT_NAME = "Bauhaus 93"
+UI_FONT_SIZES = (64, 42, 32, 20)  # Large, medium, small and tiny renderer fonts
+BUNDLED_FONT_DIR = os.path.join("assets", "fonts")
+CACHE_FILE = os.path.join(project_root(), "data", "font_cache.json")
+
+
+class FontLoader:
+    """Resolves and loads fonts once per process.
+
+    Lookup order: a bundled file in assets/fonts, the path remembered in
+    the on-disk cache, then a system font search. The system search is
+    slow on hosts with many fonts. A path it finds is written to the cache
+    so later launches skip it. A miss is not, so a font installed later is
+    picked up on the next launch.
+    """
+
+    _paths: Dict[str, Optional[str]] = {}
+    _data: Dict[str, bytes] = {}
+    _fonts: Dict[Tuple[Optional[str], int], pygame.font.Font] = {}
+    _disk_cache: Optional[Dict[str, Optional[str]]] = None
+
+    @staticmethod
+    def _bundled_path(name: str) -> Optional[str]:
+        base = os.path.join(base_path(), BUNDLED_FONT_DIR)
+        stem = name.lower().replace(" ", "")
+        for ext in (".ttf", ".otf"):
+            path = os.path.join(base, stem + ext)
+            if os.path.exists(path):
+                return path
+        return None
+
+    @staticmethod
+    def _read_disk_cache() -> Dict[str, Optional[str]]:
+        if FontLoader._disk_cache is None:
+            try:
+                with open(CACHE_FILE, "r") as f:
+                    FontLoader._disk_cache = json.load(f)
+            except (OSError, ValueError):
+                FontLoader._disk_cache = {}
+        return FontLoader._disk_cache
+
+    @staticmethod
+    def _write_disk_cache():
+        try:
+            os.makedirs(os.path.dirname(CACHE_FILE), exist_ok=True)
+            with open(CACHE_FILE, "w") as f:
+                json.dump(FontLoader._disk_cache, f, indent=2)
+        except OSError as e:
+            logging.warning(f"Failed to save font cache: {e}")
+
+    @staticmethod
+    def resolve(name: str = FONT_NAME) -> Optional[str]:
+        """Return the font file for a family name, or None to use the default font"""
+        if name in FontLoader._paths:
+            return FontLoader._paths[name]
+
+        path = FontLoader._bundled_path(name)
+        if path is None:
+            disk_cache = FontLoader._read_disk_cache()
+            cached = disk_cache.get(name)
+            if cached and os.path.exists(cached):
+                path = cached
+            else:
+                path = pygame.font.match_font(name)
+                if path is not None:
+                    disk_cache[name] = path
+                    FontLoader._write_disk_cache()
+                elif name in disk_cache:
+                    # Drop a stale entry for a font that has since been removed
+                    del disk_cache[name]
+                    FontLoader._write_disk_cache()
+
+        if path is None:
+            print(f"Warning: {name} font not found, falling back to default.")
+        FontLoader._paths[name] = path
+        return path
+
+    @staticmethod
+    def get(size: int, name: str = FONT_NAME) -> pygame.font.Font:
+        """Load a font at a size, sharing one in-memory copy of the file across sizes"""
+        path = FontLoader.resolve(name)
+        key = (path, size)
+        if key in FontLoader._fonts:
+            return FontLoader._fonts[key]
+
+        font = None
+        if path is not None:
+            try:
+                if path not in FontLoader._data:
+                    with open(path, "rb") as f:
+                        FontLoader._data[path] = f.read()
+                font = pygame.font.Font(io.BytesIO(FontLoader._data[path]), size)
+            except (OSError, pygame.error) as e:
+                logging.warning(f"Failed to load font {path}: {e}")
+        if font is None:
+            font = pygame.font.Font(None, size)
+
+        FontLoader._fonts[key] = font
+        return font
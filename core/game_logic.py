@@ -14,6 +14,10 @@ class Tilemap:
             [TileType.FLOOR for _ in range(width)] for _ in range(height)
         ]
         self._generate_default_map()
+        
+        # Immutable copy handed to render snapshots, rebuilt per changed row
+        self._frozen: Optional[Tuple[Tuple[TileType, ...], ...]] = None
+        self._dirty_rows: Set[int] = set()
     
     def _generate_default_map(self):
         for y in range(self.height):
@@ -48,6 +52,19 @@ class Tilemap:
     def destroy_tile(self, x: int, y: int):
         if self.tiles[y][x] == TileType.DESTRUCTIBLE:
             self.tiles[y][x] = TileType.FLOOR
+            self._dirty_rows.add(y)
+    
+    def frozen(self) -> Tuple[Tuple[TileType, ...], ...]:
+        """Immutable copy of the tiles; only rows changed since the last call are rebuilt"""
+        if self._frozen is None:
+            self._frozen = tuple(tuple(row) for row in self.tiles)
+        elif self._dirty_rows:
+            rows = list(self._frozen)
+            for y in self._dirty_rows:
+                rows[y] = tuple(self.tiles[y])
+            self._frozen = tuple(rows)
+        self._dirty_rows.clear()
+        return self._frozen
 
 class GamePhysics:
     @staticmethod
@@ -109,7 +126,7 @@ class GameState:
         self.game_over = False
         self.level_complete = False
         
-        self.tilemap = Tilemap(config.GRID_SIZE, config.GRID_SIZE)
+        self.tilemap = Tilemap(config.GRID_WIDTH, config.GRID_HEIGHT)
         
         if player_stats:
             max_bombs = player_stats.get("max_bombs", 1)
@@ -129,6 +146,7 @@ class GameState:
         self.enemies: List[Enemy] = []
         self.home: Optional[Home] = None
         self.events = GameEvents()
+        self.profiler = None  # Optional FrameProfiler, set while the perf overlay is on
         
         self._generate_power_ups()
         self._spawn_home()
@@ -140,8 +158,8 @@ class GameState:
     def _generate_power_ups(self):
         power_types = ["bomb_count", "blast_radius", "speed"]
         
-        for y in range(1, self.config.GRID_SIZE - 1):
-            for x in range(1, self.config.GRID_SIZE - 1):
+        for y in range(1, self.tilemap.height - 1):
+            for x in range(1, self.tilemap.width - 1):
                 if self.tilemap.tiles[y][x] == TileType.DESTRUCTIBLE:
                     if random.random() < 0.15:
                         pu = PowerUp(
@@ -151,8 +169,8 @@ class GameState:
                         self.power_ups.append(pu)
     
     def _spawn_home(self):
-        home_x = self.config.GRID_SIZE - 2
-        home_y = self.config.GRID_SIZE - 2
+        home_x = self.tilemap.width - 2
+        home_y = self.tilemap.height - 2
         self.home = Home(grid_x=home_x, grid_y=home_y, pixel_x=0.0, pixel_y=0.0)
     
     def _spawn_enemies(self):
@@ -170,8 +188,8 @@ class GameState:
         
         # Generate potential spawn points (all floor tiles except near player)
         spawn_candidates = []
-        for y in range(1, self.config.GRID_SIZE - 1):
-            for x in range(1, self.config.GRID_SIZE - 1):
+        for y in range(1, self.tilemap.height - 1):
+            for x in range(1, self.tilemap.width - 1):
                 # Skip safe zone around player (1,1)
                 if x <= 3 and y <= 3:
                     continue
@@ -200,12 +218,28 @@ class GameState:
         self.score += 50
     
     def update(self, dt: float):
-        self._update_player(dt)
-        self._update_bombs(dt)
-        self._update_explosions(dt)
-        self._update_enemies(dt)
-        self._check_collisions()
-        self._check_power_up_collection()
+        if self.profiler is None:
+            self._update_player(dt)
+            self._update_bombs(dt)
+            self._update_explosions(dt)
+            self._update_enemies(dt)
+            self._check_collisions()
+            self._check_power_up_collection()
+            return
+        
+        section = self.profiler.section
+        with section("_update_player"):
+            self._update_player(dt)
+        with section("_update_bombs"):
+            self._update_bombs(dt)
+        with section("_update_explosions"):
+            self._update_explosions(dt)
+        with section("_update_enemies"):
+            self._update_enemies(dt)
+        with section("_check_collisions"):
+            self._check_collisions()
+        with section("_check_power_up_collection"):
+            self._check_power_up_collection()
     
     def _update_player(self, dt: float):
         if self.player.is_moving:
@@ -0,0 +1,233 @@
+"""
+Headless rendering and frame export.
+
+Runs GameRenderer on SDL's dummy video driver so a GameState can be drawn
+without a display, e.g. on CI. Frames come back as NumPy views of the
+off-screen surface, or are streamed to numbered PNGs or an encoder process
+by a background writer thread.
+
+    python -m core.headless --frames 600 --png captures/frame_%05d.png
+    python -m core.headless --frames 600 --video gameplay.mp4
+    python -m core.headless --frames 600 --script inputs.json --png captures/frame_%05d.png
+
+A script is a JSON object mapping frame numbers to actions, e.g.
+{"0": ["right"], "30": ["bomb"], "31": ["left"]}.
+"""
+
+import argparse
+import json
+import os
+import queue
+import random
+import subprocess
+import threading
+from typing import Dict, List, Optional, Tuple
+
+import pygame
+
+from config.settings import GameConfig, Direction
+from core.game_logic import GameState
+from core.renderer import GameRenderer
+
+
+class HeadlessRenderer(GameRenderer):
+    """GameRenderer that draws into an off-screen surface on the dummy driver"""
+
+    def __init__(self, width: int = GameConfig.WINDOW_WIDTH, height: int = GameConfig.WINDOW_HEIGHT):
+        if not pygame.display.get_init():
+            os.environ["SDL_VIDEODRIVER"] = "dummy"
+        pygame.display.init()
+        pygame.font.init()
+
+        # The base class opens a (dummy) display mode, which convert() needs
+        super().__init__(width, height)
+        self.surface = pygame.Surface((width, height), 0, 32)
+
+    def _present(self):
+        # Nothing to show; frames are read back from self.surface
+        pass
+
+    def frame_view(self):
+        """Zero-copy (height, width, 3) NumPy view of the current frame.
+
+        The view locks the surface, so release it before the next render.
+        """
+        return pygame.surfarray.pixels3d(self.surface).transpose(1, 0, 2)
+
+    def frame_bytes(self) -> bytes:
+        """Packed RGB copy of the current frame, safe to hand to another thread"""
+        return pygame.image.tostring(self.surface, "RGB")
+
+    def render_frame(self, state: GameState, dt: float):
+        """Render a frame and return a (height, width, 3) NumPy copy of it.
+
+        Unlike frame_view(), the copy doesn't lock the surface, so frames
+        can be kept while rendering continues.
+        """
+        self.render(state, dt)
+        return pygame.surfarray.array3d(self.surface).transpose(1, 0, 2)
+
+
+class PngSequenceSink:
+    """Writes frames as numbered PNG files"""
+
+    def __init__(self, pattern: str):
+        self.pattern = pattern
+        directory = os.path.dirname(pattern)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def write(self, index: int, data: bytes, size: Tuple[int, int]):
+        surface = pygame.image.frombuffer(data, size, "RGB")
+        pygame.image.save(surface, self.pattern % index)
+
+    def close(self):
+        pass
+
+
+class EncoderSink:
+    """Pipes raw RGB frames into an encoder subprocess (ffmpeg by default)"""
+
+    def __init__(self, output: str, size: Tuple[int, int], fps: int = GameConfig.FPS,
+                 command: Optional[List[str]] = None):
+        if command is None:
+            command = [
+                "ffmpeg", "-y", "-loglevel", "error",
+                "-f", "rawvideo", "-pix_fmt", "rgb24",
+                "-s", f"{size[0]}x{size[1]}", "-r", str(fps),
+                "-i", "-",
+                "-pix_fmt", "yuv420p", output,
+            ]
+        self.process = subprocess.Popen(command, stdin=subprocess.PIPE)
+
+    def write(self, index: int, data: bytes, size: Tuple[int, int]):
+        self.process.stdin.write(data)
+
+    def close(self):
+        self.process.stdin.close()
+        self.process.wait()
+
+
+class FrameWriter:
+    """Hands frames to a sink on a background thread.
+
+    The queue is bounded so a slow sink applies back-pressure instead of
+    letting captured frames pile up in memory.
+    """
+
+    def __init__(self, sink, max_pending: int = 16):
+        self.sink = sink
+        self._queue: "queue.Queue" = queue.Queue(maxsize=max_pending)
+        self._error: Optional[BaseException] = None
+        self._thread = threading.Thread(target=self._run, name="FrameWriter", daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                break
+            if self._error is None:
+                try:
+                    self.sink.write(*item)
+                except BaseException as e:
+                    self._error = e
+
+    def submit(self, index: int, data: bytes, size: Tuple[int, int]):
+        if self._error is not None:
+            raise self._error
+        self._queue.put((index, data, size))
+
+    def close(self):
+        self._queue.put(None)
+        self._thread.join()
+        self.sink.close()
+        if self._error is not None:
+            raise self._error
+
+
+class ScriptedInput:
+    """Replays input by frame number: {frame: ["up", "bomb", ...]}"""
+
+    ACTIONS = {
+        "up": Direction.UP,
+        "down": Direction.DOWN,
+        "left": Direction.LEFT,
+        "right": Direction.RIGHT,
+    }
+
+    def __init__(self, script: Dict[int, List[str]]):
+        self.script = script
+
+    @staticmethod
+    def load(path: str) -> "ScriptedInput":
+        """Read a script from a JSON file of {"frame": [actions]}"""
+        with open(path, "r") as f:
+            data = json.load(f)
+        script = {int(frame): list(actions) for frame, actions in data.items()}
+        for actions in script.values():
+            for action in actions:
+                if action != "bomb" and action not in ScriptedInput.ACTIONS:
+                    raise ValueError(f"Unknown action in {path}: {action!r}")
+        return ScriptedInput(script)
+
+    def apply(self, state: GameState, frame: int):
+        for action in self.script.get(frame, ()):
+            if action == "bomb":
+                state.place_bomb()
+            else:
+                state.try_move(self.ACTIONS[action])
+
+
+def record(renderer: HeadlessRenderer, state: GameState, frames: int,
+           dt: float = 1.0 / GameConfig.FPS, script: Optional[ScriptedInput] = None,
+           writer: Optional[FrameWriter] = None) -> int:
+    """Simulate and render a fixed number of frames as fast as possible.
+
+    Returns the number of frames rendered; stops early on game over.
+    """
+    size = renderer.surface.get_size()
+    for frame in range(frames):
+        if script:
+            script.apply(state, frame)
+        state.update(dt)
+        renderer.render(state, dt)
+        if writer:
+            writer.submit(frame, renderer.frame_bytes(), size)
+        if state.game_over:
+            return frame + 1
+    return frames
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Render Bato Bomber frames without a display")
+    parser.add_argument("--frames", type=int, default=600)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--level", type=int, default=1)
+    parser.add_argument("--png", help="numbered PNG pattern, e.g. out/frame_%%05d.png")
+    parser.add_argument("--video", help="output video file, encoded with ffmpeg")
+    parser.add_argument("--script", help="JSON file of inputs by frame, e.g. {\"0\": [\"right\"], \"30\": [\"bomb\"]}")
+    args = parser.parse_args()
+
+    script = ScriptedInput.load(args.script) if args.script else None
+    random.seed(args.seed)
+    renderer = HeadlessRenderer()
+    state = GameState(GameConfig(), level=args.level)
+
+    sink = None
+    if args.png:
+        sink = PngSequenceSink(args.png)
+    elif args.video:
+        sink = EncoderSink(args.video, renderer.surface.get_size())
+    writer = FrameWriter(sink) if sink else None
+
+    try:
+        rendered = record(renderer, state, args.frames, script=script, writer=writer)
+    finally:
+        if writer:
+            writer.close()
+    print(f"Rendered {rendered} frames")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, Optional, Tuple
+
+import pygame
+
+# Background tracks, cycled by level
+MUSIC_TRACKS = (
+    "background_music.ogg",
+    "background_music_1.ogg",
+)
+CROSSFADE_MS = 1500
+MAX_CACHED_TRACKS = 2  # The playing track and the next level's; each is ~29 MB of PCM
+
+
+def track_for_level(level: int) -> str:
+    return MUSIC_TRACKS[(level - 1) % len(MUSIC_TRACKS)]
+
+
+class MusicPlayer:
+    """Background music on two reserved channels, crossfading between tracks.
+
+    Tracks are decoded into memory on a background thread, from the asset
+    pack or loose files via the load callback. Playback is from memory, not
+    streamed, so at most MAX_CACHED_TRACKS are kept for reuse. play()
+    never waits for a decode: a track that isn't ready starts from the
+    decoder thread as soon as it is. The next level's track can be
+    prefetched while the current one plays.
+    """
+
+    def __init__(self, load: Callable[[str], Optional[pygame.mixer.Sound]], first_channel: int):
+        self._load = load
+        if pygame.mixer.get_num_channels() < first_channel + 2:
+            pygame.mixer.set_num_channels(first_channel + 2)
+        self._channels = (pygame.mixer.Channel(first_channel), pygame.mixer.Channel(first_channel + 1))
+        pygame.mixer.set_reserved(first_channel + 2)
+
+        self._pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="Music")
+        self._tracks: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+        self._active = 0                 # Index of the channel playing (or fading in) the current track
+        self._wanted: Optional[Tuple[str, int]] = None  # Track requested by play(), and its fade
+        self.current: Optional[str] = None
+        self.volume = 0.7
+
+    def prefetch(self, track: str) -> Future:
+        """Start decoding a track in the background, if it isn't already"""
+        with self._lock:
+            if track not in self._tracks:
+                self._evict(keep=track)
+                self._tracks[track] = self._pool.submit(self._load, track)
+            return self._tracks[track]
+
+    def _evict(self, keep: str):
+        """Drop decoded tracks to make room, sparing the playing, wanted and requested ones"""
+        spared = {keep, self.current, self._wanted[0] if self._wanted else None}
+        for track in list(self._tracks):
+            if len(self._tracks) < MAX_CACHED_TRACKS:
+                break
+            if track not in spared:
+                del self._tracks[track]  # A channel still fading it out keeps its own reference
+
+    def play(self, track: str, fade_ms: int = CROSSFADE_MS):
+        """Crossfade to a track, now if decoded or else as soon as it is"""
+        with self._lock:
+            if track == self.current and self._wanted is None:
+                return
+            self._wanted = (track, fade_ms)
+        self.prefetch(track).add_done_callback(lambda future: self._start(track))
+
+    def _start(self, track: str):
+        with self._lock:
+            if self._wanted is None or self._wanted[0] != track:
+                return  # Superseded by a later play() or stop()
+            fade_ms = self._wanted[1]
+            self._wanted = None
+            future = self._tracks[track]
+            sound = future.result() if not future.exception() else None
+            if sound is None:
+                print(f"[MusicPlayer] Missing music: {track}")
+                return
+
+            outgoing = self._channels[self._active]
+            if outgoing.get_busy():
+                self._active = 1 - self._active
+            incoming = self._channels[self._active]
+            incoming.set_volume(self.volume)
+            incoming.play(sound, loops=-1, fade_ms=fade_ms)
+            if outgoing is not incoming:
+                outgoing.fadeout(fade_ms)
+            self.current = track
+
+    def stop(self, fade_ms: int = 500):
+        with self._lock:
+            self._wanted = None
+            self.current = None
+            for channel in self._channels:
+                if fade_ms:
+                    channel.fadeout(fade_ms)
+                else:
+                    channel.stop()
+
+    def set_volume(self, volume: float):
+        with self._lock:
+            self.volume = volume
+            self._channels[self._active].set_volume(volume)
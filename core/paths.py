@@ -11,3 +11,13 @@ def project_root() -> str:
         return sys._MEIPASS
     # Go up from the current file (e.g., config/settings.py)
     return os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+
+def base_path() -> str:
+    """
+    Returns the directory holding the game's code and assets/.
+    Works for scripts, PyInstaller, and Nuitka.
+    """
+    if getattr(sys, "frozen", False):
+        return sys._MEIPASS
+    # Go one level up from the 'core' directory
+    return os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -0,0 +1,87 @@
+import logging
+import queue
+import threading
+from collections import deque
+from typing import Callable, Deque, Dict, Hashable, Optional
+
+from core.game_logic import GameEvents
+
+
+class PersistenceWorker:
+    """Runs file writes (scores, settings) on one background thread.
+
+    Tasks run in the order they were submitted. A task given a key replaces
+    any task with the same key that hasn't started yet, so repeated
+    settings saves collapse into one write of the latest values. Failures
+    are held until dispatch_events() is called from the game loop, which
+    emits them on self.events as "persistence_failed", so listeners run on
+    the main thread.
+    """
+
+    def __init__(self):
+        self.events = GameEvents()
+        self._order: Deque[Hashable] = deque()
+        self._tasks: Dict[Hashable, Callable[[], None]] = {}
+        self._busy = False
+        self._stopping = False
+        self._cond = threading.Condition()
+        self._failures: "queue.SimpleQueue[dict]" = queue.SimpleQueue()
+        self._thread = threading.Thread(target=self._run, name="Persistence", daemon=True)
+        self._thread.start()
+
+    def submit(self, task: Callable[[], None], key: Optional[Hashable] = None):
+        """Queue a write; a pending task with the same key is replaced"""
+        with self._cond:
+            if self._stopping:
+                raise RuntimeError("PersistenceWorker has been shut down")
+            if key is None:
+                key = object()  # Never coalesced
+            if key not in self._tasks:
+                self._order.append(key)
+            self._tasks[key] = task
+            self._cond.notify_all()
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._order and not self._stopping:
+                    self._cond.wait()
+                if not self._order:
+                    return
+                key = self._order.popleft()
+                task = self._tasks.pop(key)
+                self._busy = True
+            try:
+                task()
+            except Exception as e:
+                self._failures.put({"key": key if isinstance(key, str) else None, "error": e})
+            finally:
+                with self._cond:
+                    self._busy = False
+                    self._cond.notify_all()
+
+    def pending(self) -> int:
+        with self._cond:
+            return len(self._order) + self._busy
+
+    def dispatch_events(self):
+        """Emit failures collected since the last call; call from the main thread"""
+        while not self._failures.empty():
+            self.events.emit("persistence_failed", self._failures.get())
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait for queued writes to finish; False if they didn't within the timeout"""
+        with self._cond:
+            return self._cond.wait_for(lambda: not self._order and not self._busy, timeout)
+
+    def shutdown(self, timeout: Optional[float] = 5.0) -> bool:
+        """Finish queued writes and stop the thread; False if writes were still running at the timeout"""
+        with self._cond:
+            self._stopping = True
+            self._cond.notify_all()
+        self._thread.join(timeout)
+        done = not self._thread.is_alive()
+        if not done:
+            logging.warning(f"Persistence: {self.pending()} write(s) still pending at shutdown")
+        self.dispatch_events()
+        return done
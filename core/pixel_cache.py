@@ -0,0 +1,107 @@
+import hashlib
+import logging
+import os
+import struct
+import sys
+from typing import Optional, Tuple
+
+import pygame
+
+from core.paths import project_root
+
+CACHE_DIR = os.path.join(project_root(), "data", "pixel_cache")
+HEADER = struct.Struct("<II")  # Width, height; raw 32-bit pixels follow
+BUFFER_FORMATS = ("RGBA", "ARGB", "BGRA")  # Layouts pygame.image.frombuffer accepts
+
+
+def _byte_order(masks: Tuple[int, ...]) -> Optional[str]:
+    """Memory order of a 32-bit surface's channels, e.g. "BGRA", if frombuffer supports it"""
+    if len(masks) != 4 or not all(masks):
+        return None
+    positions = {}
+    for channel, mask in zip("RGBA", masks):
+        byte = (mask.bit_length() - 8) // 8
+        positions[byte if sys.byteorder == "little" else 3 - byte] = channel
+    order = "".join(positions[i] for i in sorted(positions))
+    return order if order in BUFFER_FORMATS else None
+
+
+class PixelCache:
+    """Disk cache of surfaces already converted (and scaled) for the display.
+
+    Entries are raw pixel buffers keyed by the source file's hash, the
+    target size and the display's pixel format, so a hit is handed to
+    pygame.image.frombuffer with no PNG decode, convert or scale. A new
+    source file, size or display format simply misses; delete the cache
+    directory to reclaim space from old entries.
+    """
+
+    _display_format: Optional[Tuple[int, Tuple[int, ...]]] = None
+
+    @staticmethod
+    def display_format() -> Optional[Tuple[int, Tuple[int, ...]]]:
+        """Bit depth and masks convert_alpha() produces, or None without a display"""
+        if PixelCache._display_format is None:
+            if pygame.display.get_surface() is None:
+                return None
+            probe = pygame.Surface((1, 1), pygame.SRCALPHA).convert_alpha()
+            PixelCache._display_format = (probe.get_bitsize(), probe.get_masks())
+        return PixelCache._display_format
+
+    @staticmethod
+    def is_display_format(surface: pygame.Surface) -> bool:
+        """True if the surface would not change under convert_alpha()"""
+        fmt = PixelCache.display_format()
+        return (fmt is not None and bool(surface.get_flags() & pygame.SRCALPHA)
+                and (surface.get_bitsize(), surface.get_masks()) == fmt)
+
+    @staticmethod
+    def key(source, size: Optional[Tuple[int, int]] = None) -> Optional[str]:
+        """Cache key for source bytes at a target size; None if entries can't be used here"""
+        fmt = PixelCache.display_format()
+        if fmt is None or fmt[0] != 32 or _byte_order(fmt[1]) is None:
+            return None
+        digest = hashlib.sha1(source)
+        digest.update(repr((size, fmt)).encode("utf-8"))
+        return digest.hexdigest()
+
+    @staticmethod
+    def _path(key: str) -> str:
+        return os.path.join(CACHE_DIR, key + ".raw")
+
+    @staticmethod
+    def load(key: str) -> Optional[pygame.Surface]:
+        """Return the cached surface, or None on a miss"""
+        try:
+            with open(PixelCache._path(key), "rb") as f:
+                data = f.read()
+        except OSError:
+            return None
+
+        if len(data) < HEADER.size:
+            return None
+        width, height = HEADER.unpack_from(data)
+        pixels = memoryview(data)[HEADER.size:]
+        if len(pixels) != width * height * 4:
+            return None
+        try:
+            return pygame.image.frombuffer(pixels, (width, height), _byte_order(PixelCache._display_format[1]))
+        except (ValueError, pygame.error):
+            return None
+
+    @staticmethod
+    def store(key: str, surface: pygame.Surface):
+        """Write a display-format surface to the cache"""
+        order = _byte_order(surface.get_masks())
+        if order is None:
+            return
+        path = PixelCache._path(key)
+        try:
+            pixels = pygame.image.tostring(surface, order)
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            with open(path + ".tmp", "wb") as f:
+                f.write(HEADER.pack(*surface.get_size()))
+                f.write(pixels)
+            os.replace(path + ".tmp", path)
+        except (OSError, ValueError, pygame.error) as e:
+            logging.warning(f"Failed to write pixel cache entry: {e}")
@@ -0,0 +1,127 @@
+import logging
+import os
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
+from typing import Callable, Dict, List, Optional, Tuple
+
+from core.animation import SpriteFactory
+from core.atlas import SHEET_FILES
+from core.fonts import FontLoader, UI_FONT_SIZES
+from core.pixel_cache import PixelCache
+from core.sound import SFX_FILES, SoundManager
+
+
+class AssetPreloader:
+    """Decodes sprites and sounds on a thread pool at startup.
+
+    Decoding (PNG inflate, WAV/OGG parsing) runs on the workers and mostly
+    releases the GIL inside SDL. Anything that touches the display, such
+    as convert_alpha, is installed on the calling thread by poll() or
+    wait(), which feed SpriteFactory.sprite_cache and SoundManager.sounds.
+
+    Assets are queued in named groups (e.g. "menu", "game", "audio") so
+    callers can start using one group while the others are still loading.
+    """
+
+    def __init__(self, workers: Optional[int] = None):
+        self._pool = ThreadPoolExecutor(
+            max_workers=workers or min(8, os.cpu_count() or 4),
+            thread_name_prefix="Preload",
+        )
+        PixelCache.display_format()  # Probe on this thread; workers only read it
+        self._pending: List[Tuple[str, str, Future, Optional[Callable]]] = []
+        self.timings: Dict[str, float] = {}  # Asset name -> decode time in ms
+        self._group_total: Dict[str, int] = {}
+        self._group_done: Dict[str, int] = {}
+        self.started = time.perf_counter()
+
+    def _timed(self, name: str, load: Callable):
+        start = time.perf_counter()
+        try:
+            return load()
+        finally:
+            self.timings[name] = (time.perf_counter() - start) * 1000.0
+
+    def _submit(self, group: str, name: str, load: Callable, install: Optional[Callable] = None):
+        future = self._pool.submit(self._timed, name, load)
+        self._pending.append((group, name, future, install))
+        self._group_total[group] = self._group_total.get(group, 0) + 1
+        self._group_done.setdefault(group, 0)
+
+    def add_sprites(self, filenames=SHEET_FILES, group: str = "game", size=None):
+        """Queue sprite files, optionally scaled; they land in SpriteFactory.sprite_cache"""
+        for filename in filenames:
+            name = SpriteFactory.cache_name(filename, size)
+            if name in SpriteFactory.sprite_cache:
+                continue
+            self._submit(group, name, partial(SpriteFactory.decode_sprite, filename, size),
+                         partial(SpriteFactory.store_sprite, filename, size=size))
+
+    def add_sounds(self, sound_manager: SoundManager, group: str = "audio"):
+        """Queue sound effects and music for a SoundManager built with load_sounds=False"""
+        for name in SFX_FILES:
+            self._submit(group, SFX_FILES[name], partial(sound_manager.load_sfx, name),
+                         partial(sound_manager.sounds.__setitem__, name))
+        self._submit(group, "music", sound_manager.load_music)
+
+    def add_fonts(self, sizes=UI_FONT_SIZES, group: str = "menu"):
+        """Queue the UI font; the system font search can be slow on first launch"""
+        def load_fonts():
+            for size in sizes:
+                FontLoader.get(size)
+        self._submit(group, "fonts", load_fonts)
+
+    def _install(self, group: str, name: str, future: Future, install: Optional[Callable]):
+        self._group_done[group] += 1
+        try:
+            result = future.result()
+        except Exception as e:
+            logging.warning(f"Failed to preload {name}: {e}")
+            return
+        if install is not None:
+            install(result)
+
+    def poll(self) -> bool:
+        """Install whatever has finished; returns True once everything is in"""
+        still_pending = []
+        for entry in self._pending:
+            if entry[2].done():
+                self._install(*entry)
+            else:
+                still_pending.append(entry)
+        self._pending = still_pending
+        return not self._pending
+
+    def wait(self):
+        """Block until every queued asset is decoded and installed"""
+        for entry in self._pending:
+            self._install(*entry)
+        self._pending = []
+
+    def _counts(self, groups) -> Tuple[int, int]:
+        groups = groups or tuple(self._group_total)
+        done = sum(self._group_done.get(group, 0) for group in groups)
+        total = sum(self._group_total.get(group, 0) for group in groups)
+        return done, total
+
+    def ready(self, *groups: str) -> bool:
+        """True once every asset in the groups (all groups if none given) is installed"""
+        done, total = self._counts(groups)
+        return done == total
+
+    def progress(self, *groups: str) -> float:
+        done, total = self._counts(groups)
+        return done / total if total else 1.0
+
+    def shutdown(self):
+        self._pool.shutdown(wait=True)
+
+    def log_report(self):
+        """Print per-asset decode times, slowest first"""
+        elapsed = (time.perf_counter() - self.started) * 1000.0
+        busy = sum(self.timings.values())
+        print(f"[AssetPreloader] Preloaded {len(self.timings)} assets in {elapsed:.1f} ms "
+              f"({busy:.1f} ms of decoding)")
+        for name, ms in sorted(self.timings.items(), key=lambda kv: kv[1], reverse=True):
+            print(f"[AssetPreloader]   {name}: {ms:.1f} ms")
@@ -0,0 +1,59 @@
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Deque, Dict, List
+
+
+class FrameProfiler:
+    """Per-frame timings of named sections, with a rolling history.
+
+    Wrap work in ``with profiler.section(name):`` and call ``end_frame()``
+    once per frame. Averages and the frame-time histogram cover the last
+    ``history`` frames.
+    """
+
+    def __init__(self, history: int = 120):
+        self.history = history
+        self.frame_times: Deque[float] = deque(maxlen=history)
+        self.sections: Dict[str, Deque[float]] = {}
+        self._current: Dict[str, float] = {}
+        self._last_frame = time.perf_counter()
+
+    @contextmanager
+    def section(self, name: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._current[name] = self._current.get(name, 0.0) + time.perf_counter() - start
+
+    def end_frame(self):
+        now = time.perf_counter()
+        self.frame_times.append(now - self._last_frame)
+        self._last_frame = now
+
+        # Swap rather than clear: the simulation thread may still be adding to it
+        current, self._current = self._current, {}
+        for name, elapsed in current.items():
+            if name not in self.sections:
+                self.sections[name] = deque(maxlen=self.history)
+            self.sections[name].append(elapsed)
+
+    def fps(self) -> float:
+        if not self.frame_times:
+            return 0.0
+        return len(self.frame_times) / sum(self.frame_times)
+
+    def average_ms(self, name: str) -> float:
+        samples = self.sections.get(name)
+        if not samples:
+            return 0.0
+        return sum(samples) / len(samples) * 1000.0
+
+    def histogram(self, bins: int = 16, max_ms: float = 33.3) -> List[int]:
+        """Frame-time counts in equal bins up to max_ms; the last bin holds the overflow"""
+        counts = [0] * bins
+        width = max_ms / bins
+        for t in self.frame_times:
+            counts[min(int(t * 1000.0 / width), bins - 1)] += 1
+        return counts
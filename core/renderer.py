@@ -1,34 +1,48 @@
 import pygame
 import random
-import os
-from typing import List, Optional
+from typing import Optional, Tuple
 
 from config.settings import GameConfig, TileType, GameSettings
-from gameplay.entities import Player, Bomb, Explosion, PowerUp, Enemy, Home
 from core.animation import SpriteFactory
+from core.atlas import TILES, PLAYER, BOMB, EXPLOSION, POWERUPS, ENEMY
 from gameplay.leaderboard import Leaderboard
 from core.game_logic import GameState
+from core.camera import Camera
+from core.fonts import FontLoader, UI_FONT_SIZES
+from core.snapshot import RenderSnapshot, SpriteSnapshot, BombSnapshot, PowerUpSnapshot
+
+# Frame indices into the tiles and power-up sheets
+TILE_FRAMES = {
+    TileType.FLOOR: 0,
+    TileType.WALL: 1,
+    TileType.DESTRUCTIBLE: 2,
+}
+HOME_FRAME = 3
+MENU_BACKGROUND = "menu_background.png"
+MENU_BACKGROUND_SIZE = (GameConfig.WINDOW_WIDTH, GameConfig.WINDOW_HEIGHT)
+POWER_UP_FRAMES = {
+    "bomb_count": 0,
+    "blast_radius": 1,
+    "speed": 2,
+}
 
 class GameRenderer:
     def __init__(self, width: int, height: int):
         self.surface = pygame.display.set_mode((width, height))
         pygame.display.set_caption("Bato Bomber")
         
-        # Load fonts
-        try:
-            self.font_large = pygame.font.SysFont("Bauhaus 93", 64)
-            self.font_medium = pygame.font.SysFont("Bauhaus 93", 42)
-            self.font_small = pygame.font.SysFont("Bauhaus 93", 32)
-            self.font_tiny = pygame.font.SysFont("Bauhaus 93", 20)
-        except:
-            print("Warning: Bauhaus 93 font not found, falling back to default.")
-            self.font_large = pygame.font.Font(None, 64)
-            self.font_medium = pygame.font.Font(None, 42)
-            self.font_small = pygame.font.Font(None, 32)
-            self.font_tiny = pygame.font.Font(None, 20)
+        # Load fonts (path resolved once and cached between runs)
+        self.font_large, self.font_medium, self.font_small, self.font_tiny = (
+            FontLoader.get(size) for size in UI_FONT_SIZES
+        )
 
         self.tile_size = GameConfig.TILE_WIDTH
+        self.camera = Camera(GameConfig.WINDOW_WIDTH, GameConfig.WINDOW_HEIGHT, self.tile_size)
         
+        # Debug performance overlay (toggled in game with F3)
+        self.profiler = None
+        self.show_perf_overlay = False
+
         # Screen shake attributes
         self.shake_intensity = 0
         self.shake_duration = 0
@@ -38,14 +52,15 @@ class GameRenderer:
         self.background_image = self._load_background()
 
     def _load_background(self):
-        try:
-            base_path = SpriteFactory._get_base_path()
-            bg_path = os.path.join(base_path, "assets", "sprites", "menu_background.png")
-            bg = pygame.image.load(bg_path).convert()
-            return pygame.transform.scale(bg, (GameConfig.WINDOW_WIDTH, GameConfig.WINDOW_HEIGHT))
-        except Exception as e:
-            print(f"Warning: Could not load menu background: {e}")
-            return None
+        # Usually already loaded by the startup preloader, scaled and converted
+        bg = SpriteFactory.load_sprite(MENU_BACKGROUND, MENU_BACKGROUND_SIZE)
+        if bg is None:
+            print("Warning: Could not load menu background")
+        return bg
+
+    def _present(self):
+        """Show the finished frame"""
+        pygame.display.flip()
 
     def trigger_shake(self, duration=0.2, intensity=5):
         """Trigger the screen shake effect."""
@@ -54,17 +69,37 @@ class GameRenderer:
 
     def render(self, state: GameState, dt: float):
         """Render the entire game state."""
+        player = state.player
+        self.camera.follow_sprite(int(player.pixel_x), int(player.pixel_y),
+                                  state.tilemap.width, state.tilemap.height)
+        self.render_snapshot(RenderSnapshot.capture(state, self.camera.visible_rect()), dt)
+
+    def render_snapshot(self, snapshot: RenderSnapshot, dt: float):
+        """Render a frame from an immutable snapshot of the game state."""
         render_surface = pygame.Surface((GameConfig.WINDOW_WIDTH, GameConfig.WINDOW_HEIGHT))
         render_surface.fill((20, 20, 30))
 
-        self._render_tilemap(render_surface, state.tilemap)
-        self._render_power_ups(render_surface, state.power_ups)
-        self._render_home(render_surface, state.home)
-        self._render_bombs(render_surface, state.bombs)
-        self._render_explosions(render_surface, state.explosions)
-        self._render_enemies(render_surface, state.enemies)
-        self._render_player(render_surface, state.player)
-        self._render_hud(render_surface, state)
+        player = snapshot.player
+        self.camera.follow_sprite(player.pixel_x, player.pixel_y, snapshot.map_width, snapshot.map_height)
+
+        # Back to front; each layer submits its sprites with one blits() call
+        layers = (
+            (self._render_tilemap, snapshot),
+            (self._render_power_ups, snapshot.power_ups),
+            (self._render_home, snapshot.home),
+            (self._render_bombs, snapshot.bombs),
+            (self._render_explosions, snapshot.explosions),
+            (self._render_enemies, snapshot.enemies),
+            (self._render_player, snapshot.player),
+            (self._render_hud, snapshot),
+        )
+        prof = self.profiler
+        for layer, data in layers:
+            if prof is None:
+                layer(render_surface, data)
+            else:
+                with prof.section(layer.__name__):
+                    layer(render_surface, data)
 
         if self.shake_duration > 0:
             self.shake_duration -= dt
@@ -78,143 +113,208 @@ class GameRenderer:
         
         self.surface.fill((20, 20, 30))
         self.surface.blit(render_surface, self.shake_offset)
-        pygame.display.flip()
+        if self.show_perf_overlay and prof is not None:
+            self._render_perf_overlay(self.surface, snapshot)
+        self._present()
 
-    def _render_tilemap(self, surface, tilemap):
-        tiles_sprite = SpriteFactory.load_sprite("tiles.png")
-        
-        for y in range(tilemap.height):
-            for x in range(tilemap.width):
-                tile = tilemap.tiles[y][x]
-                rect = pygame.Rect(x * self.tile_size, y * self.tile_size,
-                                  self.tile_size, self.tile_size)
-                
-                if tiles_sprite:
-                    tile_index = {
-                        TileType.FLOOR: 0,
-                        TileType.WALL: 1,
-                        TileType.DESTRUCTIBLE: 2,
-                    }.get(tile, 0)
-                    
-                    source_rect = pygame.Rect(tile_index * self.tile_size, 0, 
-                                            self.tile_size, self.tile_size)
-                    surface.blit(tiles_sprite, rect, source_rect)
+    @staticmethod
+    def _submit(surface, batch):
+        """Submit one layer's (surface, dest, area) sequence in a single call"""
+        if batch:
+            surface.blits(batch, doreturn=False)
+
+    def _render_tilemap(self, surface, snapshot: RenderSnapshot):
+        atlas = SpriteFactory.get_atlas()
+        tile_frames = atlas.frames[TILES]
+        tiles = snapshot.tiles
+        ts = self.tile_size
+        cam = self.camera
+        # Only the tiles under the viewport are drawn, whatever the map size
+        x0, y0, x1, y1 = cam.visible_tiles(snapshot.map_width, snapshot.map_height)
+        
+        if tile_frames:
+            sheet = atlas.surface
+            batch = [
+                (sheet, (x * ts - cam.x, y * ts - cam.y), tile_frames[TILE_FRAMES.get(tile, 0)])
+                for y in range(y0, y1)
+                for x, tile in enumerate(tiles[y][x0:x1], x0)
+            ]
+            self._submit(surface, batch)
+            return
+        
+        for y in range(y0, y1):
+            for x in range(x0, x1):
+                tile = tiles[y][x]
+                rect = pygame.Rect(x * ts - cam.x, y * ts - cam.y, ts, ts)
+                if tile == TileType.WALL:
+                    pygame.draw.rect(surface, (80, 80, 80), rect)
+                elif tile == TileType.DESTRUCTIBLE:
+                    pygame.draw.rect(surface, (180, 120, 60), rect)
                 else:
-                    if tile == TileType.WALL:
-                        pygame.draw.rect(surface, (80, 80, 80), rect)
-                    elif tile == TileType.DESTRUCTIBLE:
-                        pygame.draw.rect(surface, (180, 120, 60), rect)
-                    else:
-                        pygame.draw.rect(surface, (220, 220, 220), rect)
+                    pygame.draw.rect(surface, (220, 220, 220), rect)
     
-    def _render_player(self, surface, player: Player):
-        player_sprite = SpriteFactory.load_sprite("player_blue.png")
-        rect = pygame.Rect(int(player.pixel_x), int(player.pixel_y),
+    def _render_player(self, surface, player: SpriteSnapshot):
+        atlas = SpriteFactory.get_atlas()
+        cam = self.camera
+        rect = pygame.Rect(player.pixel_x - cam.x, player.pixel_y - cam.y,
                           self.tile_size, self.tile_size)
         
-        if player_sprite and player.animation_controller:
-            frame_rect = player.animation_controller.get_current_frame()
-            surface.blit(player_sprite, rect, frame_rect)
+        # A single sprite; one blit is already one call
+        if atlas.has(PLAYER) and player.frame:
+            surface.blit(atlas.surface, rect, player.frame)
         else:
             pygame.draw.ellipse(surface, (100, 200, 255), rect)
             pygame.draw.circle(surface, (255, 255, 255), rect.center, 4)
     
-    def _render_bombs(self, surface, bombs: List[Bomb]):
-        bomb_sprite = SpriteFactory.load_sprite("bomb.png")
+    def _render_bombs(self, surface, bombs: Tuple[BombSnapshot, ...]):
+        atlas = SpriteFactory.get_atlas()
+        has_sprite = atlas.has(BOMB)
+        cam = self.camera
+        batch = []
         
         for bomb in bombs:
-            rect = pygame.Rect(int(bomb.pixel_x), int(bomb.pixel_y),
+            if not cam.is_visible(bomb.pixel_x, bomb.pixel_y):
+                continue
+            rect = pygame.Rect(bomb.pixel_x - cam.x, bomb.pixel_y - cam.y,
                               self.tile_size, self.tile_size)
             
-            if bomb_sprite and bomb.animation_controller:
-                frame_rect = bomb.animation_controller.get_current_frame()
-                surface.blit(bomb_sprite, rect, frame_rect)
+            if has_sprite and bomb.frame:
+                batch.append((atlas.surface, rect, bomb.frame))
             else:
                 pygame.draw.circle(surface, (50, 50, 50),
                                   rect.center, self.tile_size // 3)
             
-            timer_text = f"{int(bomb.timer + 1)}"
-            text = self.font_small.render(timer_text, True, (255, 255, 0))
-            surface.blit(text, (rect.centerx - 5, rect.centery - 5))
+            text = self.font_small.render(str(bomb.seconds_left), True, (255, 255, 0))
+            batch.append((text, (rect.centerx - 5, rect.centery - 5)))
+        
+        self._submit(surface, batch)
     
-    def _render_explosions(self, surface, explosions: List[Explosion]):
-        explosion_sprite = SpriteFactory.load_sprite("explosion.png")
+    def _render_explosions(self, surface, explosions: Tuple[SpriteSnapshot, ...]):
+        atlas = SpriteFactory.get_atlas()
+        cam = self.camera
+        visible = [exp for exp in explosions if cam.is_visible(exp.pixel_x, exp.pixel_y)]
+        
+        if atlas.has(EXPLOSION):
+            sheet = atlas.surface
+            batch = [
+                (sheet, (exp.pixel_x - cam.x, exp.pixel_y - cam.y), exp.frame)
+                for exp in visible if exp.frame
+            ]
+            self._submit(surface, batch)
+            return
         
-        for exp in explosions:
-            rect = pygame.Rect(int(exp.pixel_x), int(exp.pixel_y),
+        for exp in visible:
+            rect = pygame.Rect(exp.pixel_x - cam.x, exp.pixel_y - cam.y,
                               self.tile_size, self.tile_size)
-            
-            if explosion_sprite and exp.animation_controller:
-                frame_rect = exp.animation_controller.get_current_frame()
-                surface.blit(explosion_sprite, rect, frame_rect)
-            else:
-                pygame.draw.rect(surface, (255, 200, 50), rect)
+            pygame.draw.rect(surface, (255, 200, 50), rect)
     
-    def _render_power_ups(self, surface, power_ups: List[PowerUp]):
-        powerups_sprite = SpriteFactory.load_sprite("powerups.png")
+    def _render_power_ups(self, surface, power_ups: Tuple[PowerUpSnapshot, ...]):
+        atlas = SpriteFactory.get_atlas()
+        pu_frames = atlas.frames[POWERUPS]
+        cam = self.camera
+        visible = [pu for pu in power_ups if cam.is_visible(pu.pixel_x, pu.pixel_y)]
+        
+        if pu_frames:
+            sheet = atlas.surface
+            batch = [
+                (sheet, (pu.pixel_x - cam.x, pu.pixel_y - cam.y),
+                 pu_frames[POWER_UP_FRAMES.get(pu.power_type, 0)])
+                for pu in visible
+            ]
+            self._submit(surface, batch)
+            return
         
-        for pu in power_ups:
-            if not pu.is_revealed:
-                continue
-            
-            rect = pygame.Rect(int(pu.pixel_x), int(pu.pixel_y), 
+        for pu in visible:
+            rect = pygame.Rect(pu.pixel_x - cam.x, pu.pixel_y - cam.y,
                               self.tile_size, self.tile_size)
-            
-            if powerups_sprite:
-                pu_index = {
-                    "bomb_count": 0,
-                    "blast_radius": 1,
-                    "speed": 2,
-                }.get(pu.power_type, 0)
-                
-                source_rect = pygame.Rect(pu_index * self.tile_size, 0,
-                                        self.tile_size, self.tile_size)
-                surface.blit(powerups_sprite, rect, source_rect)
-            else:
-                pygame.draw.rect(surface, (255, 215, 0), rect)
+            pygame.draw.rect(surface, (255, 215, 0), rect)
     
-    def _render_enemies(self, surface, enemies: List[Enemy]):
-        enemy_sprite = SpriteFactory.load_sprite("enemy_red.png")
+    def _render_enemies(self, surface, enemies: Tuple[SpriteSnapshot, ...]):
+        atlas = SpriteFactory.get_atlas()
+        cam = self.camera
+        visible = [enemy for enemy in enemies if cam.is_visible(enemy.pixel_x, enemy.pixel_y)]
+        
+        if atlas.has(ENEMY):
+            sheet = atlas.surface
+            batch = [
+                (sheet, (enemy.pixel_x - cam.x, enemy.pixel_y - cam.y), enemy.frame)
+                for enemy in visible if enemy.frame
+            ]
+            self._submit(surface, batch)
+            return
         
-        for enemy in enemies:
-            rect = pygame.Rect(int(enemy.pixel_x), int(enemy.pixel_y),
+        for enemy in visible:
+            rect = pygame.Rect(enemy.pixel_x - cam.x, enemy.pixel_y - cam.y,
                               self.tile_size, self.tile_size)
-            
-            if enemy_sprite and enemy.animation_controller:
-                frame_rect = enemy.animation_controller.get_current_frame()
-                surface.blit(enemy_sprite, rect, frame_rect)
-            else:
-                pygame.draw.ellipse(surface, (255, 100, 100), rect)
-                pygame.draw.circle(surface, (255, 255, 255), rect.center, 3)
+            pygame.draw.ellipse(surface, (255, 100, 100), rect)
+            pygame.draw.circle(surface, (255, 255, 255), rect.center, 3)
     
-    def _render_home(self, surface, home: Optional[Home]):
-        if not home or not home.is_revealed:
+    def _render_home(self, surface, home: Optional[Tuple[int, int]]):
+        # Only present in the snapshot once revealed
+        if not home:
+            return
+        if not self.camera.is_visible(*home):
             return
         
-        tiles_sprite = SpriteFactory.load_sprite("tiles.png")
-        rect = pygame.Rect(int(home.pixel_x), int(home.pixel_y), 
+        atlas = SpriteFactory.get_atlas()
+        rect = pygame.Rect(home[0] - self.camera.x, home[1] - self.camera.y,
                           self.tile_size, self.tile_size)
         
-        if tiles_sprite:
-            source_rect = pygame.Rect(3 * self.tile_size, 0,
-                                    self.tile_size, self.tile_size)
-            surface.blit(tiles_sprite, rect, source_rect)
+        if atlas.has(TILES):
+            surface.blit(atlas.surface, rect, atlas.frames[TILES][HOME_FRAME])
         else:
             pygame.draw.rect(surface, (100, 150, 255), rect)
             pygame.draw.rect(surface, (200, 255, 100), rect, 3)
     
-    def _render_hud(self, surface, state: GameState):
+    def _render_hud(self, surface, snapshot: RenderSnapshot):
         hud_y = GameConfig.WINDOW_HEIGHT - 25
         hud_texts = [
-            f"Level: {state.level}",
-            f"Score: {state.score}",
-            f"Bombs: {state.player.bomb_count}/{state.player.max_bombs}",
-            f"Enemies: {len(state.enemies)}",
+            f"Level: {snapshot.level}",
+            f"Score: {snapshot.score}",
+            f"Bombs: {snapshot.bomb_count}/{snapshot.max_bombs}",
+            f"Enemies: {len(snapshot.enemies)}",
         ]
         
-        for i, text_str in enumerate(hud_texts):
-            text = self.font_tiny.render(text_str, True, (255, 255, 150))
-            surface.blit(text, (10 + i * 150, hud_y))
+        batch = [
+            (self.font_tiny.render(text_str, True, (255, 255, 150)), (10 + i * 150, hud_y))
+            for i, text_str in enumerate(hud_texts)
+        ]
+        self._submit(surface, batch)
+
+    def _render_perf_overlay(self, surface, snapshot: RenderSnapshot):
+        """Draw FPS, a frame-time histogram, section timings and entity counts"""
+        prof = self.profiler
+        color = (150, 255, 150)
+        line_height = 16
+        
+        lines = [f"FPS: {prof.fps():.1f}"]
+        lines += [f"{name}: {prof.average_ms(name):.2f} ms" for name in sorted(prof.sections)]
+        lines += [
+            f"bombs {len(snapshot.bombs)}  explosions {len(snapshot.explosions)}",
+            f"enemies {len(snapshot.enemies)}  power-ups {snapshot.power_up_count}",
+        ]
+        
+        hist = prof.histogram()
+        hist_height = 40
+        panel = pygame.Surface((300, len(lines) * line_height + hist_height + 20), pygame.SRCALPHA)
+        panel.fill((0, 0, 0, 170))
+        
+        batch = [
+            (self.font_tiny.render(line, True, color), (6, 4 + i * line_height))
+            for i, line in enumerate(lines)
+        ]
+        self._submit(panel, batch)
+        
+        # Histogram of frame times, 0-33 ms left to right
+        base_y = panel.get_height() - 6
+        peak = max(hist) or 1
+        bar_width = (panel.get_width() - 12) // len(hist)
+        for i, count in enumerate(hist):
+            h = count * hist_height // peak
+            bar_color = color if i < len(hist) // 2 else (255, 120, 80)
+            pygame.draw.rect(panel, bar_color, (6 + i * bar_width, base_y - h, bar_width - 1, h))
+        
+        surface.blit(panel, (4, 4))
 
     def _draw_menu_background(self):
         if self.background_image:
@@ -247,7 +347,7 @@ class GameRenderer:
             
             self.surface.blit(text, text_rect)
         
-        pygame.display.flip()
+        self._present()
     
     def render_options_menu(self, settings: GameSettings, selected: int = 0):
         self._draw_menu_background()
@@ -283,7 +383,7 @@ class GameRenderer:
         hint_rect = hint.get_rect(center=(GameConfig.WINDOW_WIDTH // 2, GameConfig.WINDOW_HEIGHT - 40))
         self.surface.blit(hint, hint_rect)
         
-        pygame.display.flip()
+        self._present()
     
     def render_difficulty_menu(self, selected: int = 0):
         self._draw_menu_background()
@@ -319,7 +419,7 @@ class GameRenderer:
             self.surface.blit(name_text, name_rect)
             self.surface.blit(desc_text, desc_rect)
         
-        pygame.display.flip()
+        self._present()
     
     def render_credits(self):
         self._draw_menu_background()
@@ -348,7 +448,7 @@ class GameRenderer:
             self.surface.blit(text, text_rect)
             y += 40
         
-        pygame.display.flip()
+        self._present()
     
     def render_leaderboard(self):
         self._draw_menu_background()
@@ -388,10 +488,11 @@ class GameRenderer:
         hint_rect = hint.get_rect(center=(GameConfig.WINDOW_WIDTH // 2, GameConfig.WINDOW_HEIGHT - 30))
         self.surface.blit(hint, hint_rect)
         
-        pygame.display.flip()
+        self._present()
         
-    def render_name_input(self, player_name: str = ""):
-        """Render name input screen"""
+    def render_name_input(self, player_name: str = "", percentile: Optional[float] = None,
+                          difficulty: str = "all"):
+        """Render name input screen, with where the score ranks if known"""
         self._draw_menu_background()
 
         title = self.font_large.render("NEW HIGH SCORE!", True, (255, 255, 0)) # Changed to yellow
@@ -403,6 +504,12 @@ class GameRenderer:
         )
         self.surface.blit(score_text, score_text.get_rect(center=(GameConfig.WINDOW_WIDTH // 2, 180)))
 
+        if percentile is not None:
+            rank_text = self.font_small.render(
+                f"Better than {percentile:.0f}% of {difficulty} scores",
+                True, (200, 200, 100))
+            self.surface.blit(rank_text, rank_text.get_rect(center=(GameConfig.WINDOW_WIDTH // 2, 220)))
+
         name_label = self.font_medium.render("Enter Name:", True, (255, 255, 150)) # Changed to yellow
         self.surface.blit(name_label, name_label.get_rect(center=(GameConfig.WINDOW_WIDTH // 2, 260)))
 
@@ -430,7 +537,7 @@ class GameRenderer:
             )
             self.surface.blit(surf, rect)
 
-        pygame.display.flip()
+        self._present()
     
     def show_level_complete(self):
         self._draw_menu_background()
@@ -443,7 +550,7 @@ class GameRenderer:
         self.surface.blit(score_text, score_text.get_rect(center=(GameConfig.WINDOW_WIDTH // 2, GameConfig.WINDOW_HEIGHT // 2 + 20)))
         self.surface.blit(next_text, next_text.get_rect(center=(GameConfig.WINDOW_WIDTH // 2, GameConfig.WINDOW_HEIGHT // 2 + 60)))
         
-        pygame.display.flip()
+        self._present()
         pygame.time.wait(2000)
     
     def show_game_over(self):
@@ -457,7 +564,7 @@ class GameRenderer:
         self.surface.blit(score_text, score_text.get_rect(center=(GameConfig.WINDOW_WIDTH // 2, GameConfig.WINDOW_HEIGHT // 2 + 20)))
         self.surface.blit(level_text, level_text.get_rect(center=(GameConfig.WINDOW_WIDTH // 2, GameConfig.WINDOW_HEIGHT // 2 + 60)))
         
-        pygame.display.flip()
+        self._present()
         pygame.time.wait(3000)
     
     def show_game_won(self):
@@ -469,7 +576,7 @@ class GameRenderer:
         self.surface.blit(won_text, won_text.get_rect(center=(GameConfig.WINDOW_WIDTH // 2, GameConfig.WINDOW_HEIGHT // 2 - 50)))
         self.surface.blit(score_text, score_text.get_rect(center=(GameConfig.WINDOW_WIDTH // 2, GameConfig.WINDOW_HEIGHT // 2 + 20)))
         
-        pygame.display.flip()
+        self._present()
         pygame.time.wait(3000)
 
     def render_pause_screen(self):
@@ -481,4 +588,4 @@ class GameRenderer:
         
         self.surface.blit(overlay, (0, 0))
         self.surface.blit(pause_text, text_rect)
-        pygame.display.flip()
+        self._present()
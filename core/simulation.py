@@ -0,0 +1,88 @@
+import queue
+import threading
+import time
+from typing import Callable, Optional
+
+from config.settings import GameConfig
+from core.camera import Camera
+from core.game_logic import GameState
+from core.snapshot import RenderSnapshot
+
+
+class SnapshotBuffer:
+    """Double buffer of render snapshots.
+
+    The simulation fills the back slot and then flips; the renderer always
+    reads the front slot, so it never sees a half-published frame.
+    """
+
+    def __init__(self, initial: Optional[RenderSnapshot] = None):
+        self._slots = [initial, initial]
+        self._front = 0
+        self._lock = threading.Lock()
+
+    def publish(self, snapshot: RenderSnapshot):
+        back = 1 - self._front
+        self._slots[back] = snapshot
+        with self._lock:
+            self._front = back
+
+    def latest(self) -> Optional[RenderSnapshot]:
+        with self._lock:
+            return self._slots[self._front]
+
+
+class SimulationThread(threading.Thread):
+    """Steps a GameState at a fixed rate and publishes snapshots.
+
+    Input is queued as callables taking the GameState, so the state is only
+    ever touched from this thread while it runs. The thread exits by itself
+    after publishing the frame where the game ends or the level completes.
+    Snapshots are culled to the view the renderer's camera will have, which
+    follows the player the same way.
+    """
+
+    def __init__(self, state: GameState, rate: int = GameConfig.SIMULATION_RATE):
+        super().__init__(name="Simulation", daemon=True)
+        self.state = state
+        self.step = 1.0 / rate
+        self.paused = False
+        self.camera = Camera(GameConfig.WINDOW_WIDTH, GameConfig.WINDOW_HEIGHT, GameConfig.TILE_WIDTH)
+        self.buffer = SnapshotBuffer(self._capture())
+        self._commands: "queue.SimpleQueue[Callable[[GameState], None]]" = queue.SimpleQueue()
+        self._stop_event = threading.Event()
+
+    def submit(self, command: Callable[[GameState], None]):
+        self._commands.put(command)
+
+    def run(self):
+        next_tick = time.perf_counter()
+        while not self._stop_event.is_set():
+            while not self._commands.empty():
+                self._commands.get()(self.state)
+
+            if not self.paused:
+                self.state.update(self.step)
+            self.buffer.publish(self._capture())
+
+            if self.state.game_over or self.state.level_complete:
+                return
+
+            next_tick += self.step
+            delay = next_tick - time.perf_counter()
+            if delay > 0:
+                self._stop_event.wait(delay)
+            elif delay < -5 * self.step:
+                # Too far behind to catch up; drop the backlog instead of spiralling
+                next_tick = time.perf_counter()
+
+    def _capture(self) -> RenderSnapshot:
+        state = self.state
+        self.camera.follow_sprite(int(state.player.pixel_x), int(state.player.pixel_y),
+                                  state.tilemap.width, state.tilemap.height)
+        return RenderSnapshot.capture(state, self.camera.visible_rect())
+
+    def stop(self):
+        self._stop_event.set()
+        if self.is_alive() and threading.current_thread() is not self:
+            self.join()
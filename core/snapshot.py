@@ -0,0 +1,95 @@
+from dataclasses import dataclass
+from typing import NamedTuple, Optional, Tuple
+
+import pygame
+
+from config.settings import TileType
+
+
+class SpriteSnapshot(NamedTuple):
+    pixel_x: int
+    pixel_y: int
+    frame: Optional[pygame.Rect]  # Atlas source rect; None without an animation
+
+
+class BombSnapshot(NamedTuple):
+    pixel_x: int
+    pixel_y: int
+    frame: Optional[pygame.Rect]
+    seconds_left: int
+
+
+class PowerUpSnapshot(NamedTuple):
+    pixel_x: int
+    pixel_y: int
+    power_type: str
+
+
+def _inside(entity, visible: Optional[pygame.Rect]) -> bool:
+    return visible is None or visible.collidepoint(int(entity.pixel_x), int(entity.pixel_y))
+
+
+def _sprite(entity) -> SpriteSnapshot:
+    controller = entity.animation_controller
+    frame = controller.get_current_frame() if controller else None
+    return SpriteSnapshot(int(entity.pixel_x), int(entity.pixel_y), frame)
+
+
+@dataclass(frozen=True)
+class RenderSnapshot:
+    """Everything the renderer needs for one frame, detached from GameState.
+
+    Built by the simulation and read by the renderer, possibly on another
+    thread. Frame rects are shared with the animations but never modified.
+    Given the camera's visible rect, capture() leaves out bombs, explosions,
+    enemies and power-ups the frame won't draw, so a crowded map isn't
+    copied each tick just to be culled by the renderer.
+    """
+    tiles: Tuple[Tuple[TileType, ...], ...]
+    map_width: int
+    map_height: int
+    player: SpriteSnapshot
+    bombs: Tuple[BombSnapshot, ...]
+    explosions: Tuple[SpriteSnapshot, ...]
+    enemies: Tuple[SpriteSnapshot, ...]
+    power_ups: Tuple[PowerUpSnapshot, ...]  # Revealed power-ups only
+    home: Optional[Tuple[int, int]]         # Pixel position once revealed
+    level: int
+    score: int
+    bomb_count: int
+    max_bombs: int
+    power_up_count: int
+    game_over: bool
+    level_complete: bool
+
+    @staticmethod
+    def capture(state, visible: Optional[pygame.Rect] = None) -> "RenderSnapshot":
+        """Snapshot the state; sprites outside visible (map pixels, see Camera.visible_rect) are skipped"""
+        home = state.home
+        player = state.player
+        return RenderSnapshot(
+            tiles=state.tilemap.frozen(),
+            map_width=state.tilemap.width,
+            map_height=state.tilemap.height,
+            player=_sprite(player),
+            bombs=tuple(
+                BombSnapshot(int(b.pixel_x), int(b.pixel_y),
+                             b.animation_controller.get_current_frame() if b.animation_controller else None,
+                             int(b.timer + 1))
+                for b in state.bombs if _inside(b, visible)
+            ),
+            explosions=tuple(_sprite(exp) for exp in state.explosions if _inside(exp, visible)),
+            enemies=tuple(_sprite(enemy) for enemy in state.enemies if _inside(enemy, visible)),
+            power_ups=tuple(
+                PowerUpSnapshot(int(pu.pixel_x), int(pu.pixel_y), pu.power_type)
+                for pu in state.power_ups if pu.is_revealed and _inside(pu, visible)
+            ),
+            home=(int(home.pixel_x), int(home.pixel_y)) if home and home.is_revealed else None,
+            level=state.level,
+            score=state.score,
+            bomb_count=player.bomb_count,
+            max_bombs=player.max_bombs,
+            power_up_count=len(state.power_ups),
+            game_over=state.game_over,
+            level_complete=state.level_complete,
+        )
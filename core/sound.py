@@ -1,73 +1,74 @@
 import pygame
 import os
-import sys
-import tempfile
 
-from PyQt5.QtCore import QFile, QIODevice
+from core.music import MusicPlayer, MUSIC_TRACKS, track_for_level
+from core.paths import base_path
+from core.voices import VoiceManager, VoicePolicy
+from resources import loader
+
+# Sound effect name -> file under assets/sounds (and :/sounds in the qrc)
+SFX_FILES = {
+    "place_bomb": "place_bomb.wav",
+    "explosion": "explosion.wav",
+    "level_complete": "level_complete.wav",
+    "enemy_dead": "enemy_dead.wav",
+    "hero_dead": "hero_dead.wav",
+    "powerup": "powerup.wav",
+}
+# Reserved mixer channels per category. Gameplay noise can't take the
+# channels that announce deaths and level ends.
+SFX_CATEGORIES = {
+    "gameplay": 6,
+    "events": 2,
+}
+SFX_POLICIES = {
+    "explosion": VoicePolicy("gameplay", max_voices=3, priority=1),
+    "place_bomb": VoicePolicy("gameplay", max_voices=2, priority=1),
+    "enemy_dead": VoicePolicy("gameplay", max_voices=2, priority=2),
+    "powerup": VoicePolicy("gameplay", max_voices=1, priority=3),
+    "hero_dead": VoicePolicy("events", max_voices=1, priority=5),
+    "level_complete": VoicePolicy("events", max_voices=1, priority=5),
+}
+SFX_DEDUPE_WINDOW = 0.05  # Seconds; repeat triggers inside it play once
+
 
 class SoundManager:
-    def __init__(self):
-        pygame.mixer.init()
+    def __init__(self, load_sounds=True):
+        if not pygame.mixer.get_init():
+            pygame.mixer.init()  # Normally already opened by setup_pygame
 
-        self.base_path = self._get_base_path()
+        self.base_path = base_path()
         self.sound_dir = os.path.join(self.base_path, "assets", "sounds")
 
-        self._temp_files = []  # prevent GC of temp files
-
-        self.sounds = {
-            "place_bomb": self._load_sound_hybrid(
-                qrc=":/sounds/place_bomb.wav",
-                file="place_bomb.wav",
-            ),
-            "explosion": self._load_sound_hybrid(
-                qrc=":/sounds/explosion.wav",
-                file="explosion.wav",
-            ),
-            "level_complete": self._load_sound_hybrid(
-                qrc=":/sounds/level_complete.wav",
-                file="level_complete.wav",
-            ),
-            "enemy_dead": self._load_sound_hybrid(
-                qrc=":/sounds/enemy_dead.wav",
-                file="enemy_dead.wav",
-            ),
-            "hero_dead": self._load_sound_hybrid(
-                qrc=":/sounds/hero_dead.wav",
-                file="hero_dead.wav",
-            ),
-            "powerup": self._load_sound_hybrid(
-                qrc=":/sounds/powerup.wav",
-                file="powerup.wav",
-            ),
-        }
-
-        self._load_music_hybrid(
-            qrc=":/sounds/background_music.ogg",
-            file="background_music.ogg",
-        )
+        self.voices = VoiceManager(SFX_CATEGORIES, SFX_POLICIES, SFX_DEDUPE_WINDOW)
+        self.music = MusicPlayer(self._load_track, self.voices.end_channel)
 
-    # --------------------------------------------------
-    # Base path (safe for PyInstaller / Nuitka)
-    # --------------------------------------------------
-    def _get_base_path(self):
-        if getattr(sys, "frozen", False):
-            return sys._MEIPASS
-        # Go one level up from the 'core' directory to the project root
-        return os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        # With load_sounds=False the caller fills self.sounds (see core.preload)
+        self.sounds = {}
+        if load_sounds:
+            for name in SFX_FILES:
+                self.sounds[name] = self.load_sfx(name)
+            self.load_music()
 
     # --------------------------------------------------
     # Hybrid loaders
     # --------------------------------------------------
     def _load_sound_hybrid(self, qrc: str, file: str):
-        # 1. Try QRC
+        # 1. Try the asset pack
+        asset_pack = loader.packed(qrc)
+        if asset_pack is not None:
+            try:
+                return asset_pack.load_sound(loader.pack_name(qrc))
+            except pygame.error:
+                pass
+
+        # 2. Try QRC
         try:
-            data = self._read_qrc_bytes(qrc)
-            path = self._bytes_to_tempfile(data, suffix=".wav")
-            return pygame.mixer.Sound(path)
-        except Exception:
+            return pygame.mixer.Sound(loader.resolve(qrc))
+        except (FileNotFoundError, pygame.error):
             pass
 
-        # 2. Fallback to filesystem
+        # 3. Fallback to filesystem
         try:
             path = os.path.join(self.sound_dir, file)
             return pygame.mixer.Sound(path)
@@ -75,59 +76,38 @@ class SoundManager:
             print(f"[SoundManager] Missing sound: {file}")
             return None
 
-    def _load_music_hybrid(self, qrc: str, file: str):
-        # 1. Try QRC
-        try:
-            data = self._read_qrc_bytes(qrc)
-            path = self._bytes_to_tempfile(data, suffix=".ogg")
-            pygame.mixer.music.load(path)
-            return
-        except Exception:
-            pass
+    def load_sfx(self, name):
+        """Decode one sound effect; safe to call from worker threads"""
+        file = SFX_FILES[name]
+        return self._load_sound_hybrid(qrc=":/sounds/" + file, file=file)
 
-        # 2. Fallback to filesystem
-        try:
-            path = os.path.join(self.sound_dir, file)
-            pygame.mixer.music.load(path)
-        except pygame.error:
-            print(f"[SoundManager] Missing music: {file}")
+    def _load_track(self, file):
+        return self._load_sound_hybrid(qrc=":/sounds/" + file, file=file)
 
-    # --------------------------------------------------
-    # QRC helpers
-    # --------------------------------------------------
-    def _read_qrc_bytes(self, qrc_path) -> bytes:
-        file = QFile(qrc_path)
-        if not file.open(QIODevice.ReadOnly):
-            raise FileNotFoundError(qrc_path)
-        return bytes(file.readAll())
-
-    def _bytes_to_tempfile(self, data: bytes, suffix: str) -> str:
-        tmp = tempfile.NamedTemporaryFile(delete=False, suffix=suffix)
-        tmp.write(data)
-        tmp.close()
-        self._temp_files.append(tmp.name)
-        return tmp.name
+    def load_music(self):
+        """Decode the first level's track so the first game starts with music"""
+        self.music.prefetch(MUSIC_TRACKS[0]).result()
 
     # --------------------------------------------------
     # Public API
     # --------------------------------------------------
     def play_sfx(self, name, volume=1.0):
+        """Play an effect at a per-play volume, scaled by the SFX volume"""
         snd = self.sounds.get(name)
         if snd:
-            snd.set_volume(volume)
-            snd.play()
+            self.voices.play(name, snd, volume)
 
-    def play_background_music(self, volume=0.7, loops=-1):
-        pygame.mixer.music.set_volume(volume)
-        pygame.mixer.music.play(loops)
+    def play_background_music(self, volume=0.7, level=1):
+        """Crossfade to the level's track and start decoding the next level's"""
+        self.music.set_volume(volume)
+        self.music.play(track_for_level(level))
+        self.music.prefetch(track_for_level(level + 1))
 
     def stop_background_music(self):
-        pygame.mixer.music.stop()
+        self.music.stop()
 
     def set_sfx_volume(self, volume):
-        for s in self.sounds.values():
-            if s:
-                s.set_volume(volume)
+        self.voices.set_gain(volume)
 
     def set_music_volume(self, volume):
-        pygame.mixer.music.set_volume(volume)
+        self.music.set_volume(volume)
@@ -0,0 +1,51 @@
+import pygame
+
+from core.preload import AssetPreloader
+
+BACKGROUND = (20, 20, 30)
+BAR_COLOR = (255, 200, 0)
+TEXT_COLOR = (255, 255, 255)
+
+
+class SplashScreen:
+    """Loading screen with a progress bar.
+
+    Uses only pygame's built-in font, so it can be drawn the moment the
+    window exists, before any game asset has loaded.
+    """
+
+    def __init__(self, surface: pygame.Surface):
+        self.surface = surface
+        self.font_title = pygame.font.Font(None, 56)
+        self.font_label = pygame.font.Font(None, 24)
+        self.clock = pygame.time.Clock()
+
+    def draw(self, progress: float, label: str = "Loading..."):
+        width, height = self.surface.get_size()
+        self.surface.fill(BACKGROUND)
+
+        title = self.font_title.render("BATO BOMBER", True, BAR_COLOR)
+        self.surface.blit(title, title.get_rect(center=(width // 2, height // 3)))
+
+        bar = pygame.Rect(0, 0, width * 2 // 3, 16)
+        bar.center = (width // 2, height // 2 + 20)
+        pygame.draw.rect(self.surface, TEXT_COLOR, bar, 2)
+        fill = bar.inflate(-6, -6)
+        fill.width = int(fill.width * max(0.0, min(1.0, progress)))
+        pygame.draw.rect(self.surface, BAR_COLOR, fill)
+
+        text = self.font_label.render(label, True, TEXT_COLOR)
+        self.surface.blit(text, text.get_rect(center=(width // 2, bar.bottom + 24)))
+        pygame.display.flip()
+
+    def wait(self, preloader: AssetPreloader, *groups: str, label: str = "Loading...") -> bool:
+        """Show progress until the groups have loaded; False if the window was closed"""
+        while True:
+            preloader.poll()
+            if preloader.ready(*groups):
+                return True
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    return False
+            self.draw(preloader.progress(*groups), label)
+            self.clock.tick(30)
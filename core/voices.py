@@ -0,0 +1,127 @@
+import threading
+import time
+from typing import Dict, List, NamedTuple, Optional
+
+import pygame
+
+
+class VoicePolicy(NamedTuple):
+    category: str    # Which reserved channel group the sound plays on
+    max_voices: int  # Concurrent instances of this sound
+    priority: int    # Higher priorities may steal voices from lower ones
+
+
+class Voice(NamedTuple):
+    name: str
+    priority: int
+    started: float
+    volume: float  # Per-play volume, before the bus gain
+
+
+class VoiceManager:
+    """Plays sound effects on reserved mixer channels.
+
+    Each category gets its own channels, so a burst of one kind of sound
+    can't starve another. Within a category a sound may only have
+    max_voices instances; when the category is full, the oldest voice
+    with the lowest priority not above the new sound's is stolen.
+    Repeat triggers of a sound inside the dedupe window collapse into
+    the play already started.
+
+    Volume is set per channel: each play's own volume times the bus gain.
+    The Sound objects themselves stay at full volume and are never
+    modified, so any number of plays can share one. Channel bookkeeping
+    is locked, since game events (and so plays) may come from the
+    simulation thread.
+    """
+
+    def __init__(self, categories: Dict[str, int], policies: Dict[str, VoicePolicy],
+                 dedupe_window: float = 0.05, first_channel: int = 0):
+        self.policies = policies
+        self.dedupe_window = dedupe_window
+        self.gain = 1.0
+        self.channels: Dict[str, List[int]] = {}
+
+        index = first_channel
+        for category, count in categories.items():
+            self.channels[category] = list(range(index, index + count))
+            index += count
+        self.end_channel = index  # First channel after the reserved ones
+        if pygame.mixer.get_num_channels() < index:
+            pygame.mixer.set_num_channels(index)
+        # Keep Sound.play() and other callers off our channels
+        pygame.mixer.set_reserved(index)
+
+        self._voices: Dict[int, Voice] = {}  # Last play on each channel
+        self._last_trigger: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def _busy(self, channel: int) -> Optional[Voice]:
+        voice = self._voices.get(channel)
+        if voice and pygame.mixer.Channel(channel).get_busy():
+            return voice
+        return None
+
+    def _pick_channel(self, name: str, policy: VoicePolicy) -> Optional[int]:
+        channels = self.channels[policy.category]
+        busy = {channel: self._busy(channel) for channel in channels}
+
+        # At the instance cap: restart the oldest instance of this sound
+        own = [channel for channel, voice in busy.items() if voice and voice.name == name]
+        if len(own) >= policy.max_voices:
+            return min(own, key=lambda channel: busy[channel].started)
+
+        for channel, voice in busy.items():
+            if voice is None:
+                return channel
+
+        # Category full: steal the oldest voice with the lowest priority we outrank or match
+        candidates = [channel for channel, voice in busy.items() if voice.priority <= policy.priority]
+        if not candidates:
+            return None
+        return min(candidates, key=lambda channel: (busy[channel].priority, busy[channel].started))
+
+    def play(self, name: str, sound: pygame.mixer.Sound,
+             volume: float = 1.0) -> Optional[pygame.mixer.Channel]:
+        """Play a sound under its policy; returns the channel, or None if dropped"""
+        policy = self.policies.get(name)
+        if policy is None:
+            channel = sound.play()
+            if channel:
+                channel.set_volume(volume * self.gain)
+            return channel
+
+        with self._lock:
+            now = time.perf_counter()
+            if now - self._last_trigger.get(name, float("-inf")) < self.dedupe_window:
+                return None
+
+            channel_id = self._pick_channel(name, policy)
+            if channel_id is None:
+                return None
+
+            self._last_trigger[name] = now
+            self._voices[channel_id] = Voice(name, policy.priority, now, volume)
+            channel = pygame.mixer.Channel(channel_id)
+            channel.play(sound)
+            channel.set_volume(volume * self.gain)
+            return channel
+
+    def set_gain(self, gain: float):
+        """Set the SFX bus gain; also applies to voices already playing"""
+        with self._lock:
+            self.gain = gain
+            for channel, voice in self._voices.items():
+                pygame.mixer.Channel(channel).set_volume(voice.volume * gain)
+
+    def active_voices(self) -> int:
+        """Voices currently playing on the reserved channels"""
+        return sum(1 for channels in self.channels.values()
+                   for channel in channels if self._busy(channel))
+
+    def stop(self):
+        with self._lock:
+            for channels in self.channels.values():
+                for channel in channels:
+                    pygame.mixer.Channel(channel).stop()
+            self._voices.clear()
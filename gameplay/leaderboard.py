@@ -1,11 +1,15 @@
 import json
 import os
+import time
 import datetime
 import logging
+import threading
 from dataclasses import dataclass
-from typing import List
-from security.encryption import encrypt_data, decrypt_data
+from typing import List, Optional
+from security.encryption import decrypt_data
 from core.paths import project_root  # optional
+from gameplay.score_journal import ScoreJournal
+from gameplay.score_stats import ScoreStats
 
 
 @dataclass
@@ -30,12 +34,64 @@ class ScoreEntry:
         )
 
 
+def _score_key(record: dict) -> int:
+    return record.get("score", 0)
+
+
 class Leaderboard:
     MAX_ENTRIES = 10
-    FILENAME = os.path.join(project_root(), "data", "leaderboard.json")
+    FILENAME = os.path.join(project_root(), "data", "leaderboard.json")  # Legacy single-blob file
+    JOURNAL_FILENAME = os.path.join(project_root(), "data", "leaderboard.journal")
+    STATS_FILENAME = os.path.join(project_root(), "data", "score_stats.json")
+    CACHE_CHECK_INTERVAL = 1.0  # seconds between mtime checks of the file
+    COMPACT_THRESHOLD = 100     # Journal records before a background compaction
+
+    journal = ScoreJournal(JOURNAL_FILENAME)
+    store = None  # Optional gameplay.score_store.ScoreStore with the full history; see use_store()
+    stats = ScoreStats(STATS_FILENAME)
+    _stats_loaded = False
+    _stats_lock = threading.Lock()
+    _unseen_scores: List[tuple] = []  # Added before load_stats() finished
+    _migrate_lock = threading.Lock()
+    _migrated = False
+
+    # In-process cache, kept sorted by score (highest first)
+    _cache: Optional[List[ScoreEntry]] = None
+    _cache_mtime: Optional[float] = None
+    _last_check: float = 0.0
 
     @staticmethod
-    def load() -> List[ScoreEntry]:
+    def _file_mtime() -> Optional[float]:
+        try:
+            return os.stat(Leaderboard.journal.path).st_mtime
+        except OSError:
+            return None
+
+    @staticmethod
+    def _cache_valid() -> bool:
+        """Check the cache against the file's mtime, at most once per interval"""
+        if Leaderboard._cache is None:
+            return False
+        now = time.monotonic()
+        if now - Leaderboard._last_check < Leaderboard.CACHE_CHECK_INTERVAL:
+            return True
+        Leaderboard._last_check = now
+        return Leaderboard._file_mtime() == Leaderboard._cache_mtime
+
+    @staticmethod
+    def _store_cache(scores: List[ScoreEntry], mtime: Optional[float]):
+        Leaderboard._cache = sorted(scores, key=lambda x: x.score, reverse=True)
+        Leaderboard._cache_mtime = mtime
+        Leaderboard._last_check = time.monotonic()
+
+    @staticmethod
+    def invalidate_cache():
+        """Drop the cached scores so the next read goes to disk"""
+        Leaderboard._cache = None
+        Leaderboard._cache_mtime = None
+
+    @staticmethod
+    def _read_legacy_file() -> List[ScoreEntry]:
         if not os.path.exists(Leaderboard.FILENAME):
             return []
         try:
@@ -48,20 +104,198 @@ class Leaderboard:
             logging.warning(f"Failed to load leaderboard: {e}")
             return []
 
+    @staticmethod
+    def _migrate():
+        """Seed the journal from the old leaderboard.json the first time it is needed.
+
+        Runs once per process, whichever thread gets there first; an append
+        waits for it so the rewrite can't drop a newer score.
+        """
+        with Leaderboard._migrate_lock:
+            if Leaderboard._migrated:
+                return
+            if not Leaderboard.journal.exists():
+                scores = Leaderboard._read_legacy_file()
+                if scores:
+                    Leaderboard.journal.rewrite(s.to_dict() for s in scores)
+            Leaderboard._migrated = True
+
+    @staticmethod
+    def use_store(store):
+        """Keep scores in a ScoreStore, importing the existing leaderboard into it once"""
+        Leaderboard._migrate()
+        try:
+            records = Leaderboard.journal.records()
+        except OSError:
+            pass  # Logged by the journal; the import is retried next launch
+        else:
+            store.migrate(ScoreEntry.from_dict(record) for record in records)
+        Leaderboard.store = store
+        Leaderboard.invalidate_cache()
+
+    @staticmethod
+    def _read_file() -> List[ScoreEntry]:
+        if Leaderboard.store is not None:
+            return Leaderboard.store.top(Leaderboard.MAX_ENTRIES)
+        try:
+            Leaderboard._migrate()
+            records = Leaderboard.journal.top(Leaderboard.MAX_ENTRIES, _score_key)
+        except Exception as e:
+            logging.warning(f"Failed to load leaderboard: {e}")
+            return []
+        return [ScoreEntry.from_dict(record) for record in records]
+
+    @staticmethod
+    def load() -> List[ScoreEntry]:
+        if not Leaderboard._cache_valid():
+            Leaderboard.refresh_cache()
+        return list(Leaderboard._cache)
+
+    @staticmethod
+    def refresh_cache():
+        """Re-read the board into the cache; queue on a PersistenceWorker to keep it off the game loop"""
+        mtime = Leaderboard._file_mtime()
+        Leaderboard._store_cache(Leaderboard._read_file(), mtime)
+
     @staticmethod
     def save(scores: List[ScoreEntry]):
-        os.makedirs(os.path.dirname(Leaderboard.FILENAME), exist_ok=True)
+        """Replace the whole leaderboard with these scores"""
         try:
-            scores_json = json.dumps([s.to_dict() for s in scores], indent=2)
-            encrypted_scores = encrypt_data(scores_json)
-            with open(Leaderboard.FILENAME, "wb") as f:
-                f.write(encrypted_scores)
+            Leaderboard.journal.rewrite(s.to_dict() for s in scores)
         except Exception as e:
             logging.warning(f"Failed to save leaderboard: {e}")
+            Leaderboard.invalidate_cache()
+            return
+        # Write-through: the cache now mirrors what is on disk
+        Leaderboard._store_cache(scores[:Leaderboard.MAX_ENTRIES], Leaderboard._file_mtime())
 
     @staticmethod
-    def add_score(name: str, score: int, level: int, difficulty: str) -> bool:
-        scores = Leaderboard.load()
+    def load_stats(writer=None):
+        """Load the running stats, seeding them from the board if they were never saved.
+
+        Reads and decrypts files, so keep it off the game loop: the
+        controller queues it on its PersistenceWorker at startup. A store
+        seeds from the full score history. The journal only holds what
+        survived compaction (the top MAX_ENTRIES, plus anything added since),
+        so a journal-only install starts with percentiles skewed high until
+        enough new scores have been recorded.
+        """
+        if Leaderboard._stats_loaded:
+            return
+        stats = ScoreStats(Leaderboard.STATS_FILENAME)
+        seeded = not stats.load()
+        if seeded:
+            if Leaderboard.store is not None:
+                stats.add_many(Leaderboard.store.top(Leaderboard.store.count()))
+            else:
+                Leaderboard._migrate()
+                stats.add_many(ScoreEntry.from_dict(r) for r in Leaderboard.journal.records())
+        with Leaderboard._stats_lock:
+            # Scores added while loading weren't in the file or board read above
+            for score, difficulty, level in Leaderboard._unseen_scores:
+                stats.add(score, difficulty, level)
+            seeded = seeded or bool(Leaderboard._unseen_scores)
+            Leaderboard._unseen_scores = []
+            Leaderboard.stats = stats
+            Leaderboard._stats_loaded = True
+        if seeded:
+            Leaderboard._save_stats(writer)
+
+    @staticmethod
+    def _save_stats(writer=None):
+        with Leaderboard._stats_lock:
+            if not Leaderboard._stats_loaded:
+                return  # load_stats() saves once it has merged the scores held back
+            stats = Leaderboard.stats
+            stats_json = stats.to_json()
+        if writer is not None:
+            # Keyed, so a backlog of score writes saves the stats only once
+            writer.submit(lambda: stats.write(stats_json), key="score_stats")
+            return
+        try:
+            stats.write(stats_json)
+        except Exception as e:
+            logging.warning(f"Failed to save score stats: {e}")
+
+    @staticmethod
+    def percentile(score: int, difficulty: Optional[str] = None, level: Optional[int] = None) -> Optional[float]:
+        """Percentage of recorded scores (for a difficulty or level, if given) below this one.
+
+        None until load_stats() has finished, so callers on the game loop never wait on it.
+        """
+        with Leaderboard._stats_lock:
+            if not Leaderboard._stats_loaded:
+                return None
+            return Leaderboard.stats.percentile(score, difficulty, level)
+
+    @staticmethod
+    def _record_stats(score: int, difficulty: str, level: int):
+        with Leaderboard._stats_lock:
+            if Leaderboard._stats_loaded:
+                Leaderboard.stats.add(score, difficulty, level)
+            else:
+                Leaderboard._unseen_scores.append((score, difficulty, level))
+
+    @staticmethod
+    def _append(entry: ScoreEntry, on_worker: bool = False):
+        """Write one score to the store or journal; raises on failure.
+
+        A journal past COMPACT_THRESHOLD is compacted, on its own thread
+        unless already on the worker. On the worker a store add is left in
+        its batch for _flush_and_refresh to commit.
+        """
+        if Leaderboard.store is not None:
+            Leaderboard.store.add(entry)
+            if not on_worker:
+                Leaderboard.store.flush()
+            return
+        Leaderboard._migrate()
+        Leaderboard.journal.append(entry.to_dict())
+        count = Leaderboard.journal.record_count
+        if count is not None and count > Leaderboard.COMPACT_THRESHOLD:
+            if on_worker:
+                Leaderboard.journal.compact(Leaderboard.MAX_ENTRIES, _score_key)
+            else:
+                Leaderboard.journal.compact_async(Leaderboard.MAX_ENTRIES, _score_key)
+
+    @staticmethod
+    def _append_queued(entry: ScoreEntry, writer):
+        """Worker-side half of add_score: write, then queue the commit and cache refresh"""
+        try:
+            Leaderboard._append(entry, on_worker=True)
+        except Exception:
+            Leaderboard.invalidate_cache()  # Drop the entry that never reached disk
+            raise
+        # Keyed, so scores queued back to back share one store commit and one re-read
+        writer.submit(Leaderboard._flush_and_refresh, key="leaderboard_cache")
+
+    @staticmethod
+    def _flush_and_refresh():
+        try:
+            if Leaderboard.store is not None:
+                Leaderboard.store.flush()
+        except Exception:
+            Leaderboard.invalidate_cache()
+            raise
+        Leaderboard.refresh_cache()
+
+    @staticmethod
+    def add_score(name: str, score: int, level: int, difficulty: str, writer=None) -> bool:
+        """Add a score; with a core.persistence.PersistenceWorker the write happens in the background.
+
+        Returns whether the score made the top entries. With a writer, nothing
+        is read or written on the calling thread: the score is merged into the
+        cached board if one is loaded (otherwise the worker reads the board
+        after writing, and this returns False), and failures are reported
+        through the worker's events instead of the return value.
+        """
+        # Seed before appending, so this score is counted once
+        if writer is not None:
+            if not Leaderboard._stats_loaded:
+                # Ahead of the append in the worker's queue; a no-op if already queued and run
+                writer.submit(lambda: Leaderboard.load_stats(writer), key="load_stats")
+        else:
+            Leaderboard.load_stats()
         entry = ScoreEntry(
             name=name,
             score=score,
@@ -69,13 +303,35 @@ class Leaderboard:
             difficulty=difficulty,
             date=datetime.datetime.now().strftime("%Y-%m-%d %H:%M")
         )
+        if writer is not None:
+            writer.submit(lambda: Leaderboard._append_queued(entry, writer))
+            Leaderboard._record_stats(score, difficulty, level)
+            Leaderboard._save_stats(writer)
+            cached = Leaderboard._cache
+            if cached is None:
+                return False
+            # Show it now; the worker replaces the cache once the write lands
+            scores = sorted(cached + [entry], key=lambda x: x.score, reverse=True)[:Leaderboard.MAX_ENTRIES]
+            Leaderboard._cache = scores
+            return entry in scores
+
+        scores = Leaderboard.load()
+        try:
+            Leaderboard._append(entry)
+        except Exception as e:
+            logging.warning(f"Failed to save leaderboard: {e}")
+            Leaderboard.invalidate_cache()
+            return False
         scores.append(entry)
         scores.sort(key=lambda x: x.score, reverse=True)
         scores = scores[:Leaderboard.MAX_ENTRIES]
-        Leaderboard.save(scores)
+        # Write-through: the appended record can only change the top entries we hold
+        Leaderboard._store_cache(scores, Leaderboard._file_mtime())
+        Leaderboard._record_stats(score, difficulty, level)
+        Leaderboard._save_stats()
         return entry in scores
 
     @staticmethod
     def get_top_scores() -> List[ScoreEntry]:
-        scores = Leaderboard.load()
-        return sorted(scores, key=lambda x: x.score, reverse=True)
+        # Cache is already sorted; no decrypt or sort after the first call
+        return Leaderboard.load()
@@ -0,0 +1,170 @@
+"""
+Merge the leaderboards of many machines into one.
+
+Each board is read with its own key file, and the boards are decrypted in
+parallel on a process pool. Each worker returns only its board's top N,
+sorted, and each result is folded into one bounded top-N heap as soon as
+its worker finishes, then dropped. Memory therefore stays at N records
+plus the results still in flight, however many boards there are. Scores
+seen on several boards, e.g. after a board was copied between kiosks, are
+kept once. The result is written as one board encrypted with the output
+key.
+
+    python -m gameplay.leaderboard_merge -o merged.journal \\
+        --board kiosk1/data/leaderboard.journal kiosk1/data/secret.key \\
+        --board kiosk2/data/leaderboard.json kiosk2/data/secret.key
+    python -m gameplay.leaderboard_merge -o merged.journal --key data/secret.key kiosks/*/data
+
+A board ending in .journal is a score journal; any other file is an old
+single-blob leaderboard.json. A directory stands for the board and
+secret.key inside it.
+"""
+
+import argparse
+import heapq
+import itertools
+import json
+import logging
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from gameplay.leaderboard import Leaderboard, ScoreEntry, _score_key
+from gameplay.score_journal import ScoreJournal
+from security.cipher import CipherService
+
+JOURNAL_NAME = os.path.basename(Leaderboard.JOURNAL_FILENAME)
+LEGACY_NAME = os.path.basename(Leaderboard.FILENAME)
+KEY_NAME = "secret.key"
+
+Board = Tuple[str, str]  # (leaderboard path, key file path)
+
+
+def _read_keys(key_path: str) -> List[bytes]:
+    with open(key_path, "rb") as key_file:
+        return [line.strip() for line in key_file.read().splitlines() if line.strip()]
+
+
+def _cipher_for(key_path: str) -> CipherService:
+    keys = _read_keys(key_path)
+    return CipherService(lambda: keys)
+
+
+def board_in(directory: str) -> Board:
+    """The board and key in a data directory, preferring the journal"""
+    path = os.path.join(directory, JOURNAL_NAME)
+    if not os.path.exists(path):
+        path = os.path.join(directory, LEGACY_NAME)
+    return path, os.path.join(directory, KEY_NAME)
+
+
+def read_board(board: Board, limit: int) -> Tuple[str, List[dict], Optional[str]]:
+    """Decrypt one board and return its top records, highest first, or an error message"""
+    path, key_path = board
+    try:
+        cipher = _cipher_for(key_path)
+        if path.endswith(".journal"):
+            records = ScoreJournal(path, cipher).top(limit, _score_key)
+        else:
+            with open(path, "rb") as f:
+                data = json.loads(cipher.decrypt(f.read().strip()))
+            records = heapq.nlargest(limit, data, key=_score_key)
+    except Exception as e:
+        return path, [], f"{type(e).__name__}: {e}"
+    # Normalise through ScoreEntry so every record has every field
+    return path, [ScoreEntry.from_dict(record).to_dict() for record in records], None
+
+
+def _identity(record: dict) -> tuple:
+    return (record["name"], record["score"], record["level"], record["difficulty"], record["date"])
+
+
+def merge_top(sorted_boards: Iterable[List[dict]], limit: int) -> List[dict]:
+    """Fold boards sorted highest first into the top limit records, dropping duplicates.
+
+    Boards are consumed one at a time, in any order, into a min-heap of at
+    most limit records; each board is only read down to the heap's floor.
+    """
+    heap = []       # (score, arrival, record), lowest score on top
+    held = set()    # Identities of the records in the heap
+    arrival = itertools.count()
+    for records in sorted_boards:
+        for record in records:
+            score = _score_key(record)
+            if len(heap) >= limit and score <= heap[0][0]:
+                break  # The rest of this board is no higher
+            identity = _identity(record)
+            if identity in held:
+                continue
+            held.add(identity)
+            item = (score, next(arrival), record)
+            if len(heap) < limit:
+                heapq.heappush(heap, item)
+            else:
+                held.discard(_identity(heapq.heapreplace(heap, item)[2]))
+    return [record for _, _, record in sorted(heap, key=lambda item: (-item[0], item[1]))]
+
+
+def read_boards(boards: Sequence[Board], limit: int, jobs: Optional[int] = None) -> Iterator[List[dict]]:
+    """Top records of each board as soon as its worker finishes; unreadable boards are skipped"""
+    readable = []
+    for board in boards:
+        # A missing board would otherwise read as an empty journal
+        if os.path.isfile(board[0]):
+            readable.append(board)
+        else:
+            logging.warning(f"Skipped {board[0]}: no such file")
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        # as_completed drops each future once yielded, so finished results aren't kept
+        for future in as_completed([pool.submit(read_board, board, limit) for board in readable]):
+            path, records, error = future.result()
+            if error:
+                logging.warning(f"Skipped {path}: {error}")
+                continue
+            yield records
+
+
+def write_board(records: List[dict], output: str, cipher: CipherService):
+    """Write records as a journal (.journal) or an old-style single-blob board"""
+    if output.endswith(".journal"):
+        ScoreJournal(output, cipher).rewrite(records)
+        return
+    tmp_path = output + ".tmp"
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(tmp_path, "wb") as f:
+        f.write(cipher.encrypt(json.dumps(records).encode("utf-8")))
+    os.replace(tmp_path, output)
+
+
+def merge(boards: Sequence[Board], output: str, cipher: CipherService,
+          limit: int = Leaderboard.MAX_ENTRIES, jobs: Optional[int] = None) -> List[dict]:
+    records = merge_top(read_boards(boards, limit, jobs), limit)
+    write_board(records, output, cipher)
+    return records
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Merge leaderboards from many machines into one")
+    parser.add_argument("dirs", nargs="*", help="data directories holding a leaderboard and secret.key")
+    parser.add_argument("--board", nargs=2, action="append", default=[], metavar=("LEADERBOARD", "KEY"),
+                        help="a leaderboard file and the key file it was encrypted with")
+    parser.add_argument("-o", "--output", required=True, help="merged board (.journal, or a single blob)")
+    parser.add_argument("--key", help="key file for the output (default: this machine's key)")
+    parser.add_argument("--top", type=int, default=Leaderboard.MAX_ENTRIES, help="entries to keep")
+    parser.add_argument("--jobs", type=int, help="worker processes (default: one per CPU)")
+    args = parser.parse_args()
+
+    boards = [board_in(directory) for directory in args.dirs] + [tuple(board) for board in args.board]
+    if not boards:
+        parser.error("no boards given")
+    cipher = _cipher_for(args.key) if args.key else CipherService.default()
+
+    start = time.perf_counter()
+    records = merge(boards, args.output, cipher, args.top, args.jobs)
+    print(f"Merged {len(boards)} board(s) into {args.output}: {len(records)} entries "
+          f"in {time.perf_counter() - start:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
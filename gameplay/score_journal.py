@@ -0,0 +1,153 @@
+import heapq
+import json
+import logging
+import os
+import threading
+from typing import Iterable, Iterator, List, Optional
+
+from security.cipher import CipherService
+
+
+class ScoreJournal:
+    """Append-only file of individually encrypted score records.
+
+    Each line is one Fernet token holding one score as JSON. Adding a
+    score appends a line, so a crash can at worst tear that one line,
+    which is skipped on read. Compaction rewrites the journal down to the
+    records worth keeping in a temp file and swaps it in with os.replace;
+    records appended while it runs are carried over, and a rewrite() that
+    lands first wins, abandoning the compaction.
+    """
+
+    def __init__(self, path: str, cipher: Optional[CipherService] = None):
+        self.path = path
+        self._cipher = cipher
+        self._lock = threading.Lock()  # Serialises appends with the compaction swap
+        self._compacting = False
+        self._generation = 0  # Bumped whenever the file is replaced
+        self.record_count: Optional[int] = None  # Known after a full read
+
+    @property
+    def cipher(self) -> CipherService:
+        return self._cipher or CipherService.default()
+
+    def exists(self) -> bool:
+        return os.path.exists(self.path)
+
+    def _encode(self, record: dict) -> bytes:
+        return self.cipher.encrypt(json.dumps(record).encode("utf-8")) + b"\n"
+
+    def append(self, record: dict):
+        """Durably append one record"""
+        line = self._encode(record)
+        with self._lock:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            with open(self.path, "ab+") as f:
+                # Start on a fresh line if a previous write was torn
+                empty = f.seek(0, os.SEEK_END) == 0
+                if not empty:
+                    f.seek(-1, os.SEEK_END)
+                    if f.read(1) != b"\n":
+                        line = b"\n" + line
+                f.write(line)
+                f.flush()
+                os.fsync(f.fileno())
+            if empty:
+                self.record_count = 1
+            elif self.record_count is not None:
+                self.record_count += 1
+
+    def _decode_lines(self, lines: Iterable[bytes]) -> Iterator[dict]:
+        skipped = 0
+        for line in lines:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield json.loads(self.cipher.decrypt(line))
+            except Exception:
+                skipped += 1
+        if skipped:
+            logging.warning(f"Skipped {skipped} unreadable record(s) in {self.path}")
+
+    def records(self) -> Iterator[dict]:
+        """Every readable record, oldest first; empty if there is no journal yet.
+
+        Raises OSError if the journal exists but can't be read.
+        """
+        try:
+            with open(self.path, "rb") as f:
+                lines = f.readlines()
+        except FileNotFoundError:
+            self.record_count = 0
+            return iter(())
+        except OSError as e:
+            logging.warning(f"Failed to read {self.path}: {e}")
+            raise
+        self.record_count = len(lines)
+        return self._decode_lines(lines)
+
+    def top(self, k: int, key) -> List[dict]:
+        """The k highest records by key, built in one pass over the journal"""
+        return heapq.nlargest(k, self.records(), key=key)
+
+    def _replace(self, lines: List[bytes], tail: bytes = b""):
+        tmp_path = self.path + ".tmp"
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        with open(tmp_path, "wb") as f:
+            f.writelines(lines)
+            f.write(tail)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
+        self._generation += 1
+        self.record_count = len(lines) + tail.count(b"\n")
+
+    def rewrite(self, records: Iterable[dict]):
+        """Atomically replace the journal with these records"""
+        lines = [self._encode(record) for record in records]
+        with self._lock:
+            self._replace(lines)
+
+    def compact(self, k: int, key):
+        """Rewrite the journal down to its top k records"""
+        with self._lock:
+            generation = self._generation
+        try:
+            with open(self.path, "rb") as f:
+                inode = os.fstat(f.fileno()).st_ino
+                snapshot = f.read()
+        except OSError:
+            return
+        # Only whole lines; an append in flight lands in the tail below
+        snapshot = snapshot[:snapshot.rfind(b"\n") + 1]
+        keep = heapq.nlargest(k, self._decode_lines(snapshot.splitlines()), key=key)
+        lines = [self._encode(record) for record in keep]
+
+        with self._lock:
+            # Replaced since the snapshot (e.g. by rewrite()); that version wins
+            if self._generation != generation or os.stat(self.path).st_ino != inode:
+                return
+            # Carry over anything appended since the snapshot was taken
+            with open(self.path, "rb") as f:
+                f.seek(len(snapshot))
+                tail = f.read()
+            self._replace(lines, tail)
+
+    def compact_async(self, k: int, key) -> bool:
+        """Compact on a background thread; False if one is already running"""
+        with self._lock:
+            if self._compacting:
+                return False
+            self._compacting = True
+
+        def run():
+            try:
+                self.compact(k, key)
+            except Exception as e:
+                logging.warning(f"Failed to compact {self.path}: {e}")
+            finally:
+                self._compacting = False
+
+        threading.Thread(target=run, name="JournalCompaction", daemon=True).start()
+        return True
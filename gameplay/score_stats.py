@@ -0,0 +1,174 @@
+import json
+import logging
+import math
+import os
+from typing import Dict, Iterable, List, Optional
+
+from security.cipher import CipherService
+
+# Scores below EXACT_LIMIT get a bucket each; above it every power of two is
+# split into SUB_BUCKETS, so a bucket is at most 1/8 of the scores it holds
+SUB_BUCKET_BITS = 3
+SUB_BUCKETS = 1 << SUB_BUCKET_BITS
+EXACT_LIMIT = 2 * SUB_BUCKETS
+
+
+def bucket_index(score: int) -> int:
+    if score < EXACT_LIMIT:
+        return max(score, 0)
+    shift = score.bit_length() - SUB_BUCKET_BITS - 1
+    return EXACT_LIMIT + (shift - 1) * SUB_BUCKETS + (score >> shift) - SUB_BUCKETS
+
+
+def bucket_bounds(index: int):
+    """[low, high) scores held by a bucket"""
+    if index < EXACT_LIMIT:
+        return index, index + 1
+    shift = (index - EXACT_LIMIT) // SUB_BUCKETS + 1
+    low = (SUB_BUCKETS + (index - EXACT_LIMIT) % SUB_BUCKETS) << shift
+    return low, low + (1 << shift)
+
+
+class RunningStats:
+    """Count, mean and a quantile sketch of a stream of scores.
+
+    The mean and variance use Welford's update. The sketch is a histogram
+    over fixed log-spaced buckets, so it grows with the size of the largest
+    score rather than the number of scores: scores below 2**31 need at most
+    232 buckets, and percentile() walks no more than that.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+        self.buckets: List[int] = []
+
+    def add(self, score: int):
+        self.count += 1
+        delta = score - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (score - self.mean)
+
+        index = bucket_index(score)
+        if index >= len(self.buckets):
+            self.buckets.extend([0] * (index + 1 - len(self.buckets)))
+        self.buckets[index] += 1
+
+    @property
+    def stddev(self) -> float:
+        return math.sqrt(self._m2 / self.count) if self.count else 0.0
+
+    def percentile(self, score: int) -> Optional[float]:
+        """Percentage of recorded scores below this one, or None if there are none"""
+        if not self.count:
+            return None
+        index = bucket_index(score)
+        below = sum(self.buckets[:index])
+        if index < len(self.buckets):
+            # Assume the scores in the bucket are spread evenly across it
+            low, high = bucket_bounds(index)
+            below += self.buckets[index] * (score - low) / (high - low)
+        return 100.0 * below / self.count
+
+    def quantile(self, q: float) -> Optional[int]:
+        """Approximate score at quantile q (0..1)"""
+        if not self.count:
+            return None
+        target = q * self.count
+        seen = 0
+        for index, n in enumerate(self.buckets):
+            if n and seen + n >= target:
+                low, high = bucket_bounds(index)
+                return int(low + (high - low) * (target - seen) / n)
+            seen += n
+        return bucket_bounds(len(self.buckets) - 1)[0]
+
+    def to_dict(self) -> dict:
+        return {"count": self.count, "mean": self.mean, "m2": self._m2, "buckets": self.buckets}
+
+    @staticmethod
+    def from_dict(data: dict) -> "RunningStats":
+        stats = RunningStats()
+        stats.count = data.get("count", 0)
+        stats.mean = data.get("mean", 0.0)
+        stats._m2 = data.get("m2", 0.0)
+        stats.buckets = list(data.get("buckets", []))
+        return stats
+
+
+class ScoreStats:
+    """Running statistics for every score added, overall and per difficulty and level.
+
+    Kept up to date by Leaderboard.add_score and saved to their own small
+    encrypted file, so they cover scores the top-N board has dropped and
+    answering a query never means reading the board. See
+    Leaderboard.load_stats for how they are first seeded.
+    """
+
+    def __init__(self, path: str, cipher: Optional[CipherService] = None):
+        self.path = path
+        self._cipher = cipher
+        self.overall = RunningStats()
+        self.by_difficulty: Dict[str, RunningStats] = {}
+        self.by_level: Dict[int, RunningStats] = {}
+
+    @property
+    def cipher(self) -> CipherService:
+        return self._cipher or CipherService.default()
+
+    def exists(self) -> bool:
+        return os.path.exists(self.path)
+
+    def add(self, score: int, difficulty: str, level: int):
+        self.overall.add(score)
+        self.by_difficulty.setdefault(difficulty, RunningStats()).add(score)
+        self.by_level.setdefault(level, RunningStats()).add(score)
+
+    def add_many(self, entries: Iterable):
+        for entry in entries:
+            self.add(entry.score, entry.difficulty, entry.level)
+
+    def group(self, difficulty: Optional[str] = None, level: Optional[int] = None) -> Optional[RunningStats]:
+        """Stats for one difficulty or level, or all scores; None if nothing was recorded there"""
+        if difficulty is not None:
+            return self.by_difficulty.get(difficulty)
+        if level is not None:
+            return self.by_level.get(level)
+        return self.overall
+
+    def percentile(self, score: int, difficulty: Optional[str] = None,
+                   level: Optional[int] = None) -> Optional[float]:
+        stats = self.group(difficulty, level)
+        return stats.percentile(score) if stats else None
+
+    def to_json(self) -> str:
+        return json.dumps({
+            "overall": self.overall.to_dict(),
+            "difficulty": {name: s.to_dict() for name, s in self.by_difficulty.items()},
+            "level": {str(level): s.to_dict() for level, s in self.by_level.items()},
+        })
+
+    def load(self) -> bool:
+        """Read saved stats; False if there were none or they couldn't be read"""
+        try:
+            with open(self.path, "rb") as f:
+                data = json.loads(self.cipher.decrypt(f.read().strip()))
+        except FileNotFoundError:
+            return False
+        except Exception as e:
+            logging.warning(f"Failed to load score stats: {e}")
+            return False
+        self.overall = RunningStats.from_dict(data.get("overall", {}))
+        self.by_difficulty = {name: RunningStats.from_dict(s) for name, s in data.get("difficulty", {}).items()}
+        self.by_level = {int(level): RunningStats.from_dict(s) for level, s in data.get("level", {}).items()}
+        return True
+
+    def write(self, stats_json: str):
+        """Encrypt and atomically write serialised stats; raises on failure"""
+        token = self.cipher.encrypt(stats_json.encode("utf-8"))
+        tmp_path = self.path + ".tmp"
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        with open(tmp_path, "wb") as f:
+            f.write(token)
+        os.replace(tmp_path, self.path)
@@ -0,0 +1,168 @@
+import os
+import sqlite3
+import threading
+from typing import Iterable, List, Optional, Tuple
+
+from core.paths import project_root
+from gameplay.leaderboard import ScoreEntry
+
+DB_FILE = os.path.join(project_root(), "data", "scores.db")
+BATCH_SIZE = 256
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS scores (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    score INTEGER NOT NULL,
+    level INTEGER NOT NULL,
+    difficulty TEXT NOT NULL,
+    date TEXT NOT NULL DEFAULT ''
+);
+CREATE INDEX IF NOT EXISTS scores_by_difficulty ON scores (difficulty, score DESC);
+CREATE INDEX IF NOT EXISTS scores_by_level ON scores (level, score DESC);
+CREATE INDEX IF NOT EXISTS scores_by_score ON scores (score DESC);
+CREATE INDEX IF NOT EXISTS scores_by_name ON scores (name, score DESC);
+CREATE TABLE IF NOT EXISTS player_bests (
+    name TEXT PRIMARY KEY,
+    score INTEGER NOT NULL,
+    level INTEGER NOT NULL,
+    difficulty TEXT NOT NULL,
+    date TEXT NOT NULL DEFAULT ''
+);
+CREATE INDEX IF NOT EXISTS player_bests_by_score ON player_bests (score DESC);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+
+class ScoreStore:
+    """Complete score history in SQLite, for tournaments.
+
+    Every score is kept, and top-N queries by difficulty, level or overall
+    walk an index, so they stay fast at hundreds of thousands of rows.
+    Writes are buffered and committed in batches; queries flush first, so
+    they always see earlier adds. Unlike the leaderboard journal the
+    database is not encrypted, since it has to be indexed by score.
+    """
+
+    def __init__(self, path: str = DB_FILE):
+        self.path = path
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+        self._fill_player_bests()
+        self._pending: List[Tuple] = []
+        self._lock = threading.Lock()
+
+    # --------------------------------------------------
+    # Writes
+    # --------------------------------------------------
+    def add(self, entry: ScoreEntry):
+        """Queue a score; written with the next batch"""
+        with self._lock:
+            self._pending.append((entry.name, entry.score, entry.level, entry.difficulty, entry.date))
+            if len(self._pending) >= BATCH_SIZE:
+                self._flush_locked()
+
+    def add_many(self, entries: Iterable[ScoreEntry]):
+        for entry in entries:
+            self.add(entry)
+
+    def flush(self):
+        """Commit queued scores in one transaction"""
+        with self._lock:
+            self._flush_locked()
+
+    def _flush_locked(self):
+        if not self._pending:
+            return
+        with self._conn:
+            self._conn.executemany(
+                "INSERT INTO scores (name, score, level, difficulty, date) VALUES (?, ?, ?, ?, ?)",
+                self._pending,
+            )
+            self._conn.executemany(
+                "INSERT INTO player_bests (name, score, level, difficulty, date) VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT(name) DO UPDATE SET score = excluded.score, level = excluded.level, "
+                "difficulty = excluded.difficulty, date = excluded.date "
+                "WHERE excluded.score > player_bests.score",
+                self._pending,
+            )
+        self._pending = []
+
+    def _fill_player_bests(self):
+        """Build player_bests for a database written before the table existed"""
+        with self._conn:
+            if self._conn.execute("SELECT 1 FROM player_bests LIMIT 1").fetchone():
+                return
+            self._conn.execute(
+                "INSERT INTO player_bests (name, score, level, difficulty, date) "
+                "SELECT name, MAX(score), level, difficulty, date FROM scores GROUP BY name")
+
+    # --------------------------------------------------
+    # Queries
+    # --------------------------------------------------
+    def _query(self, sql: str, params: Tuple) -> List[ScoreEntry]:
+        with self._lock:
+            self._flush_locked()
+            rows = self._conn.execute(sql, params).fetchall()
+        return [ScoreEntry(name, score, level, difficulty, date)
+                for name, score, level, difficulty, date in rows]
+
+    def top(self, limit: int = 10, offset: int = 0, difficulty: Optional[str] = None,
+            level: Optional[int] = None) -> List[ScoreEntry]:
+        """A page of the highest scores, optionally for one difficulty or level"""
+        where, params = [], []
+        if difficulty is not None:
+            where.append("difficulty = ?")
+            params.append(difficulty)
+        if level is not None:
+            where.append("level = ?")
+            params.append(level)
+        sql = "SELECT name, score, level, difficulty, date FROM scores"
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        sql += " ORDER BY score DESC LIMIT ? OFFSET ?"
+        return self._query(sql, tuple(params) + (limit, offset))
+
+    def player_best(self, name: str) -> Optional[ScoreEntry]:
+        rows = self._query(
+            "SELECT name, score, level, difficulty, date FROM scores "
+            "WHERE name = ? ORDER BY score DESC LIMIT 1", (name,))
+        return rows[0] if rows else None
+
+    def player_bests(self, limit: int = 10, offset: int = 0) -> List[ScoreEntry]:
+        """Each player's best score, highest first; kept up to date on every flush"""
+        return self._query(
+            "SELECT name, score, level, difficulty, date FROM player_bests "
+            "ORDER BY score DESC LIMIT ? OFFSET ?", (limit, offset))
+
+    def count(self) -> int:
+        with self._lock:
+            self._flush_locked()
+            return self._conn.execute("SELECT COUNT(*) FROM scores").fetchone()[0]
+
+    # --------------------------------------------------
+    # Migration
+    # --------------------------------------------------
+    def migrate(self, entries: Iterable[ScoreEntry]) -> bool:
+        """Import existing scores once; later calls do nothing"""
+        with self._lock:
+            self._flush_locked()
+            if self._conn.execute("SELECT 1 FROM meta WHERE key = 'migrated'").fetchone():
+                return False
+        self.add_many(entries)
+        with self._lock:
+            self._flush_locked()
+            with self._conn:
+                self._conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('migrated', '1')")
+        return True
+
+    def close(self):
+        self.flush()
+        self._conn.close()
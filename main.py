@@ -1,19 +1,35 @@
 import pygame
 import sys
+from typing import Optional
 from config.settings import GameConfig, GameSettings, MenuState, Direction, GameDifficulty
 from core.game_logic import GameState
-from core.renderer import GameRenderer
+from core.renderer import GameRenderer, MENU_BACKGROUND, MENU_BACKGROUND_SIZE
 from gameplay.leaderboard import Leaderboard
 from core.sound import SoundManager
+from core.preload import AssetPreloader
+from core.splash import SplashScreen
+from core.animation import SpriteFactory
+from core.profiler import FrameProfiler
+from core.simulation import SimulationThread
+from core.persistence import PersistenceWorker
 from config.app_config import setup_pygame
 
 class GameController:
-    def __init__(self, state: GameState, renderer: GameRenderer):
+    def __init__(self, state: Optional[GameState], renderer: GameRenderer,
+                 sound_manager: SoundManager = None, preloader: AssetPreloader = None):
         self.state = state
         self.renderer = renderer
-        self.sound_manager = SoundManager()
+        self.sound_manager = sound_manager or SoundManager()
+        self.preloader = preloader  # Still loading gameplay and audio assets while set
         self.clock = pygame.time.Clock()
         self.running = True
+        self.profiler = FrameProfiler()
+        self.simulation = None  # SimulationThread when GameConfig.THREADED_SIMULATION is on
+        self.persistence = PersistenceWorker()  # Score and settings writes, off the frame loop
+        self.persistence.events.subscribe("persistence_failed", self._on_persistence_failed)
+        # Leaderboard and score stats, read off the frame loop
+        self.persistence.submit(Leaderboard.refresh_cache, key="leaderboard_cache")
+        self.persistence.submit(lambda: Leaderboard.load_stats(self.persistence), key="load_stats")
         
         # Menu state
         self.menu_state = MenuState.MAIN
@@ -24,45 +40,121 @@ class GameController:
         self.player_name = ""
         self.game_score = 0
         self.game_level = 0
+        self.game_percentile = None  # Share of earlier scores this game beat, for the name screen
         
         # Update game difficulty and sound volumes
         self._apply_difficulty()
         self.sound_manager.set_sfx_volume(self.settings.sfx_volume)
         self.sound_manager.set_music_volume(self.settings.music_volume)
         
-        # Subscribe to game events
-        self.state.events.subscribe("explosion", self._on_explosion)
-        self.state.events.subscribe("bomb_placed", self._on_bomb_placed)
-        self.state.events.subscribe("level_complete", self._on_level_complete)
-        self.state.events.subscribe("enemy_killed", self._on_enemy_killed)
-        self.state.events.subscribe("player_dead", self._on_player_dead)
-        self.state.events.subscribe("power_up_collected", self._on_power_up_collected)
+        if self.state:
+            self._bind_state(self.state)
+
+    def _bind_state(self, state: GameState):
+        """Subscribe to a new game state's events and attach the profiler"""
+        state.events.subscribe("explosion", self._on_explosion)
+        state.events.subscribe("bomb_placed", self._on_bomb_placed)
+        state.events.subscribe("level_complete", self._on_level_complete)
+        state.events.subscribe("enemy_killed", self._on_enemy_killed)
+        state.events.subscribe("player_dead", self._on_player_dead)
+        state.events.subscribe("power_up_collected", self._on_power_up_collected)
+        state.profiler = self.renderer.profiler
+
+    def _poll_assets(self):
+        """Install assets finished by the background preloader"""
+        if self.preloader and self.preloader.poll():
+            self._assets_loaded()
+
+    def _assets_loaded(self):
+        self.preloader.shutdown()
+        self.preloader.log_report()
+        self.preloader = None
+        SpriteFactory.get_atlas()  # Build now rather than on the first game frame
+
+    def _wait_for_assets(self) -> bool:
+        """Show the loading screen until everything is in; False if the window was closed"""
+        if not self.preloader:
+            return True
+        if not SplashScreen(self.renderer.surface).wait(self.preloader):
+            self.running = False
+            return False
+        self._assets_loaded()
+        return True
+
+    def _start_simulation(self):
+        """Hand the current game state to a simulation thread, if enabled"""
+        if GameConfig.THREADED_SIMULATION:
+            self.simulation = SimulationThread(self.state, GameConfig.SIMULATION_RATE)
+            self.simulation.start()
+
+    def _stop_simulation(self):
+        """Stop the simulation thread so the game state can be used from this thread"""
+        if self.simulation:
+            self.simulation.stop()
+            self.simulation = None
+
+    def _game_command(self, command, *args):
+        """Apply an input command now, or queue it for the simulation thread"""
+        if self.simulation:
+            self.simulation.submit(lambda state: command(state, *args))
+        else:
+            command(self.state, *args)
+
+    def _advance_game(self, dt: float):
+        """Update and draw one game frame"""
+        if self.simulation:
+            # The simulation steps itself; draw the latest published snapshot
+            self.renderer.render_snapshot(self.simulation.buffer.latest(), dt)
+        else:
+            self.state.update(dt)
+            self.renderer.render(self.state, dt)
+        if self.renderer.profiler:
+            self.renderer.profiler.end_frame()
+
+    def toggle_perf_overlay(self):
+        """Show or hide the performance overlay; timings are only collected while shown"""
+        enabled = not self.renderer.show_perf_overlay
+        self.renderer.show_perf_overlay = enabled
+        self.renderer.profiler = self.profiler if enabled else None
+        if self.state:
+            self.state.profiler = self.renderer.profiler
 
     def _on_explosion(self, data):
         """Handle the explosion event."""
         if self.settings.screen_shake:
             self.renderer.trigger_shake()
-        self.sound_manager.play_sfx('explosion', self.settings.sfx_volume)
+        self.sound_manager.play_sfx('explosion')
 
     def _on_bomb_placed(self, data):
         """Handle the bomb placed event."""
-        self.sound_manager.play_sfx('place_bomb', self.settings.sfx_volume)
+        self.sound_manager.play_sfx('place_bomb')
 
     def _on_level_complete(self, data):
         """Handle the level complete event."""
-        self.sound_manager.play_sfx('level_complete', self.settings.sfx_volume)
+        self.sound_manager.play_sfx('level_complete')
 
     def _on_enemy_killed(self, data):
         """Handle the enemy killed event."""
-        self.sound_manager.play_sfx('enemy_dead', self.settings.sfx_volume)
+        self.sound_manager.play_sfx('enemy_dead')
 
     def _on_player_dead(self, data):
         """Handle the player dead event."""
-        self.sound_manager.play_sfx('hero_dead', self.settings.sfx_volume)
+        self.sound_manager.play_sfx('hero_dead')
 
     def _on_power_up_collected(self, data):
         """Handle the power-up collected event."""
-        self.sound_manager.play_sfx('powerup', self.settings.sfx_volume)
+        self.sound_manager.play_sfx('powerup')
+
+    def _on_persistence_failed(self, data):
+        target = data.get("key") or "scores"
+        print(f"Warning: Could not save {target}: {data.get('error')}")
+
+    def shutdown(self):
+        """Stop background work, writing out anything still queued"""
+        self._stop_simulation()
+        self.persistence.shutdown()
+        if Leaderboard.store is not None:
+            Leaderboard.store.close()  # Commits any scores still in the batch
 
     def _apply_difficulty(self):
         """Apply difficulty settings to game state"""
@@ -96,8 +188,9 @@ class GameController:
                         self.player_name = self.player_name[:-1]
                     elif event.key == pygame.K_SPACE or event.key == pygame.K_RETURN:
                         if self.player_name.strip():
-                            Leaderboard.add_score(self.player_name, self.game_score, 
-                                                self.game_level, self.settings.difficulty.name)
+                            Leaderboard.add_score(self.player_name, self.game_score,
+                                                self.game_level, self.settings.difficulty.name,
+                                                writer=self.persistence)
                             self.player_name = ""
                             self.menu_state = MenuState.MAIN
                             self.menu_selected = 0
@@ -131,7 +224,7 @@ class GameController:
                         difficulties = [GameDifficulty.EASY, GameDifficulty.NORMAL, 
                                       GameDifficulty.HARD, GameDifficulty.NIGHTMARE]
                         self.settings.difficulty = difficulties[self.menu_selected]
-                        self.settings.save()
+                        self.settings.save(self.persistence)
                         self.menu_state = MenuState.MAIN
                         self.menu_selected = 2
                     elif event.key == pygame.K_ESCAPE:
@@ -146,15 +239,13 @@ class GameController:
     def _handle_main_menu_select(self):
         """Handle main menu selection"""
         if self.menu_selected == 0:  # Start Game
+            if not self._wait_for_assets():
+                return
             self.menu_state = MenuState.GAME
             self.state = GameState(GameConfig(), level=1, difficulty=self.settings.difficulty)
-            self.state.events.subscribe("explosion", self._on_explosion)
-            self.state.events.subscribe("bomb_placed", self._on_bomb_placed)
-            self.state.events.subscribe("level_complete", self._on_level_complete)
-            self.state.events.subscribe("enemy_killed", self._on_enemy_killed)
-            self.state.events.subscribe("player_dead", self._on_player_dead)
-            self.state.events.subscribe("power_up_collected", self._on_power_up_collected)
+            self._bind_state(self.state)
             self._apply_difficulty()
+            self._start_simulation()
             self.sound_manager.play_background_music(self.settings.music_volume)
         elif self.menu_selected == 1:  # Leaderboard
             self.menu_state = MenuState.LEADERBOARD
@@ -173,11 +264,14 @@ class GameController:
         if self.menu_selected == 1:  # Music volume
             self.settings.music_volume = max(0.0, min(1.0, self.settings.music_volume + step))
             self.sound_manager.set_music_volume(self.settings.music_volume)
+            self.settings.save(self.persistence)
         elif self.menu_selected == 2:  # SFX volume
             self.settings.sfx_volume = max(0.0, min(1.0, self.settings.sfx_volume + step))
             self.sound_manager.set_sfx_volume(self.settings.sfx_volume)
+            self.settings.save(self.persistence)
         elif self.menu_selected == 3:  # Screen shake
             self.settings.screen_shake = not self.settings.screen_shake
+            self.settings.save(self.persistence)
         elif self.menu_selected == 0:  # Difficulty
             self.menu_state = MenuState.DIFFICULTY
             self.menu_selected = 0
@@ -186,26 +280,32 @@ class GameController:
         """Handle in-game input"""
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
+                self._stop_simulation()
                 self.running = False
                 self.menu_state = MenuState.MAIN
             elif event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_p:
+                if event.key == pygame.K_F3:
+                    self.toggle_perf_overlay()
+                elif event.key == pygame.K_p:
                     if self.menu_state == MenuState.GAME:
                         self.menu_state = MenuState.PAUSED
                     elif self.menu_state == MenuState.PAUSED:
                         self.menu_state = MenuState.GAME
+                    if self.simulation:
+                        self.simulation.paused = self.menu_state == MenuState.PAUSED
                 elif self.menu_state == MenuState.GAME:
                     if event.key == pygame.K_UP:
-                        self.state.try_move(Direction.UP)
+                        self._game_command(GameState.try_move, Direction.UP)
                     elif event.key == pygame.K_DOWN:
-                        self.state.try_move(Direction.DOWN)
+                        self._game_command(GameState.try_move, Direction.DOWN)
                     elif event.key == pygame.K_LEFT:
-                        self.state.try_move(Direction.LEFT)
+                        self._game_command(GameState.try_move, Direction.LEFT)
                     elif event.key == pygame.K_RIGHT:
-                        self.state.try_move(Direction.RIGHT)
+                        self._game_command(GameState.try_move, Direction.RIGHT)
                     elif event.key == pygame.K_SPACE:
-                        self.state.place_bomb()
+                        self._game_command(GameState.place_bomb)
                     elif event.key == pygame.K_ESCAPE:
+                        self._stop_simulation()
                         self.menu_state = MenuState.MAIN
                         self.sound_manager.stop_background_music()
                         self.menu_selected = 0
@@ -214,6 +314,8 @@ class GameController:
         """Main game loop"""
         while self.running:
             dt = self.clock.tick(GameConfig.FPS) / 1000.0
+            self._poll_assets()
+            self.persistence.dispatch_events()
             
             if self.menu_state == MenuState.MAIN:
                 self.handle_menu_input()
@@ -225,7 +327,8 @@ class GameController:
             
             elif self.menu_state == MenuState.NAME_INPUT:
                 self.handle_menu_input()
-                self.renderer.render_name_input(self.player_name)
+                self.renderer.render_name_input(self.player_name, self.game_percentile,
+                                                self.settings.difficulty.name)
             
             elif self.menu_state == MenuState.OPTIONS:
                 self.handle_menu_input()
@@ -246,10 +349,10 @@ class GameController:
             elif self.menu_state == MenuState.GAME:
                 if not self.state.game_over:
                     self.handle_game_input()
-                    self.state.update(dt)
-                    self.renderer.render(self.state, dt)
+                    self._advance_game(dt)
                     
                     if self.state.level_complete:
+                        self._stop_simulation()
                         self.renderer.score = self.state.score
                         self.renderer.level = self.state.level
                         self.renderer.show_level_complete()
@@ -261,25 +364,25 @@ class GameController:
                                 "blast_radius": self.state.player.blast_radius
                             }
                             self.state = GameState(GameConfig(), level=next_level, difficulty=self.settings.difficulty, initial_score=current_score, player_stats=player_stats)
-                            self.state.events.subscribe("explosion", self._on_explosion)
-                            self.state.events.subscribe("bomb_placed", self._on_bomb_placed)
-                            self.state.events.subscribe("level_complete", self._on_level_complete)
-                            self.state.events.subscribe("enemy_killed", self._on_enemy_killed)
-                            self.state.events.subscribe("player_dead", self._on_player_dead)
-                            self.state.events.subscribe("power_up_collected", self._on_power_up_collected)
+                            self._bind_state(self.state)
+                            self._start_simulation()
+                            self.sound_manager.play_background_music(self.settings.music_volume, next_level)
                         else:
                             self.renderer.show_game_won()
                             self.game_score = self.state.score
                             self.game_level = self.state.level
+                            self.game_percentile = Leaderboard.percentile(self.game_score, self.settings.difficulty.name)
                             self.menu_state = MenuState.NAME_INPUT
                             self.player_name = ""
                             self.sound_manager.stop_background_music()
                 else:
+                    self._stop_simulation()
                     self.renderer.score = self.state.score
                     self.renderer.level = self.state.level
                     self.renderer.show_game_over()
                     self.game_score = self.state.score
                     self.game_level = self.state.level
+                    self.game_percentile = Leaderboard.percentile(self.game_score, self.settings.difficulty.name)
                     self.menu_state = MenuState.NAME_INPUT
                     self.player_name = ""
                     self.sound_manager.stop_background_music()
@@ -287,20 +390,37 @@ class GameController:
             self.clock.tick(GameConfig.FPS)
 
 def main():
-    pygame.init()
-
     screen, clock = setup_pygame()
+    splash = SplashScreen(screen)
+    splash.draw(0.0)
+
+    # Menu assets first; gameplay sprites and audio keep loading behind the menus
+    preloader = AssetPreloader()
+    preloader.add_fonts(group="menu")
+    preloader.add_sprites([MENU_BACKGROUND], group="menu", size=MENU_BACKGROUND_SIZE)
+    preloader.add_sprites(group="game")
+    sound_manager = SoundManager(load_sounds=False)
+    preloader.add_sounds(sound_manager, group="audio")
+
+    if not splash.wait(preloader, "menu"):
+        preloader.shutdown()
+        pygame.quit()
+        sys.exit()
 
     config = GameConfig()
+    if config.SQLITE_SCORES:
+        from gameplay.score_store import ScoreStore
+        Leaderboard.use_store(ScoreStore())
+
     renderer = GameRenderer(config.WINDOW_WIDTH, config.WINDOW_HEIGHT)
 
-    # Start with menu (no initial game state)
-    state = GameState(config, level=1)
-    controller = GameController(state, renderer)
+    # Start with menu (no game state until a game is started)
+    controller = GameController(None, renderer, sound_manager, preloader)
     controller.menu_state = MenuState.MAIN
     controller.menu_selected = 0
     
     controller.run()
+    controller.shutdown()
     pygame.quit()
     sys.exit()
 
@@ -0,0 +1,108 @@
+"""
+Qt-free access to bundled resources.
+
+Serves the same ":/..." paths the game used with QFile, by mapping the
+entries of resources.qrc back to files on disk. Nothing here imports Qt,
+so resource access no longer pulls the Qt runtime into startup.
+
+When assets/assets.pak exists (see resources.pack), assets are served
+from it instead of from loose files.
+"""
+
+import os
+import re
+import sys
+from typing import Dict, Optional
+
+from resources.pack import AssetPack
+
+QRC_FILE = "resources.qrc"
+PACK_FILE = os.path.join("assets", "assets.pak")
+
+_FILE_ENTRY = re.compile(r'<file(?:\s+alias="([^"]*)")?\s*>([^<]+)</file>')
+_index: Optional[Dict[str, str]] = None
+_pack: Optional[AssetPack] = None
+_pack_checked = False
+
+
+def _base_path() -> str:
+    if getattr(sys, "frozen", False):
+        return sys._MEIPASS
+    return os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _build_index() -> Dict[str, str]:
+    """Map resource keys (with and without the leading assets/) to file paths"""
+    base = _base_path()
+    resources_dir = os.path.join(base, "resources")
+    index = {}
+    try:
+        with open(os.path.join(resources_dir, QRC_FILE), "r") as f:
+            text = f.read()
+    except OSError:
+        return index
+
+    for alias, entry in _FILE_ENTRY.findall(text):
+        path = os.path.normpath(os.path.join(resources_dir, entry.strip()))
+        key = os.path.relpath(path, base).replace(os.sep, "/")
+        index[key] = path
+        if key.startswith("assets/"):
+            index[key[len("assets/"):]] = path
+        if alias:
+            index[alias] = path
+    return index
+
+
+def resolve(resource_path: str) -> str:
+    """Return the file behind a ':/...' path; raises FileNotFoundError"""
+    global _index
+    if _index is None:
+        _index = _build_index()
+
+    key = resource_path[2:] if resource_path.startswith(":/") else resource_path
+    if key in _index:
+        return _index[key]
+
+    # Not listed in the .qrc (e.g. a frozen build without it): look under the root
+    base = _base_path()
+    for candidate in (key, "assets/" + key):
+        path = os.path.join(base, candidate)
+        if os.path.exists(path):
+            return path
+    raise FileNotFoundError(resource_path)
+
+
+def pack() -> Optional[AssetPack]:
+    """The asset pack, mapped on first use; None when the game runs from loose files"""
+    global _pack, _pack_checked
+    if not _pack_checked:
+        _pack_checked = True
+        path = os.path.join(_base_path(), PACK_FILE)
+        if os.path.exists(path):
+            try:
+                _pack = AssetPack(path)
+            except (OSError, ValueError) as e:
+                print(f"Warning: Could not open asset pack: {e}")
+    return _pack
+
+
+def pack_name(resource_path: str) -> str:
+    """Pack entry name for a ':/...' path or a path relative to assets/"""
+    key = resource_path[2:] if resource_path.startswith(":/") else resource_path
+    return key[len("assets/"):] if key.startswith("assets/") else key
+
+
+def packed(resource_path: str) -> Optional[AssetPack]:
+    """The pack if it holds this resource, else None"""
+    asset_pack = pack()
+    if asset_pack is not None and pack_name(resource_path) in asset_pack:
+        return asset_pack
+    return None
+
+
+def read_bytes(resource_path: str) -> bytes:
+    asset_pack = packed(resource_path)
+    if asset_pack is not None:
+        return bytes(asset_pack.view(pack_name(resource_path)))
+    with open(resolve(resource_path), "rb") as f:
+        return f.read()
@@ -0,0 +1,209 @@
+"""
+Single-file asset pack.
+
+Layout: an 8-byte magic, a little-endian u32 index length, a JSON index
+mapping asset names (paths relative to assets/, e.g. "sounds/explosion.wav")
+to [offset, length], then the asset bytes back to back in index order.
+
+The pack is opened with mmap and assets are served as memoryviews into
+the mapping, so loading never copies a file into Python bytes or writes
+it back out to a temp file.
+
+    python -m resources.pack                 # build assets/assets.pak
+    python -m resources.pack --output build/assets.pak
+"""
+
+import argparse
+import io
+import json
+import mmap
+import os
+import struct
+import sys
+from typing import Dict, Iterable, List, Optional, Tuple
+
+MAGIC = b"BATOPAK1"
+HEADER = struct.Struct("<8sI")
+PACKED_DIRS = ("sprites", "sounds", "icon")
+PACKED_EXTENSIONS = (".png", ".wav", ".ogg", ".ico", ".ttf", ".otf")
+
+# pygame mixer format codes for the PCM widths a WAV file can hold
+_WAV_FORMATS = {1: 8, 2: -16}  # 8-bit WAV is unsigned, 16-bit is signed
+
+
+class ViewReader(io.RawIOBase):
+    """Read-only, seekable file object over a memoryview"""
+
+    def __init__(self, view: memoryview):
+        super().__init__()
+        self._view = view
+        self._pos = 0
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def readinto(self, buffer) -> int:
+        chunk = self._view[self._pos:self._pos + len(buffer)]
+        n = len(chunk)
+        buffer[:n] = chunk
+        self._pos += n
+        return n
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_CUR:
+            offset += self._pos
+        elif whence == io.SEEK_END:
+            offset += len(self._view)
+        self._pos = max(0, min(offset, len(self._view)))
+        return self._pos
+
+    def tell(self) -> int:
+        return self._pos
+
+
+class AssetPack:
+    """A memory-mapped asset pack.
+
+    The whole file is mapped once and the kernel is asked to read it ahead,
+    so asset I/O is a single sequential read however many assets load.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if hasattr(self._mmap, "madvise") and hasattr(mmap, "MADV_WILLNEED"):
+            self._mmap.madvise(mmap.MADV_WILLNEED)
+
+        magic, index_len = HEADER.unpack_from(self._mmap, 0)
+        if magic != MAGIC:
+            self._mmap.close()
+            raise ValueError(f"{path} is not an asset pack")
+        data_start = HEADER.size + index_len
+        index = json.loads(self._mmap[HEADER.size:data_start].decode("utf-8"))
+        self._index: Dict[str, Tuple[int, int]] = {
+            name: (data_start + offset, length) for name, (offset, length) in index.items()
+        }
+        self._view = memoryview(self._mmap)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._index
+
+    def names(self) -> List[str]:
+        return list(self._index)
+
+    def view(self, name: str) -> memoryview:
+        """Zero-copy view of an asset; raises KeyError"""
+        offset, length = self._index[name]
+        return self._view[offset:offset + length]
+
+    def reader(self, name: str) -> ViewReader:
+        return ViewReader(self.view(name))
+
+    def load_image(self, name: str):
+        """Decode an image straight from the mapping"""
+        import pygame
+        return pygame.image.load(self.reader(name), os.path.basename(name))
+
+    def load_sound(self, name: str):
+        """Create a Sound, handing PCM samples to the mixer directly when possible.
+
+        A WAV whose format already matches the mixer is passed as a buffer
+        over its data chunk; anything else is decoded from a file object
+        over the mapping.
+        """
+        import pygame
+        view = self.view(name)
+        pcm = _wav_pcm(view)
+        if pcm is not None and pcm[0] == pygame.mixer.get_init():
+            return pygame.mixer.Sound(buffer=pcm[1])
+        return pygame.mixer.Sound(file=ViewReader(view))
+
+    def close(self):
+        self._view.release()
+        self._mmap.close()
+
+
+def _wav_pcm(view: memoryview) -> Optional[Tuple[Tuple[int, int, int], memoryview]]:
+    """Return ((frequency, format, channels), samples) for a plain PCM WAV, or None
+    if the file is anything else, including a truncated or malformed one"""
+    if len(view) < 12 or bytes(view[0:4]) != b"RIFF" or bytes(view[8:12]) != b"WAVE":
+        return None
+    try:
+        return _parse_wav_chunks(view)
+    except (struct.error, ValueError):
+        return None  # Let pygame's own loader decide what to make of it
+
+
+def _parse_wav_chunks(view: memoryview) -> Optional[Tuple[Tuple[int, int, int], memoryview]]:
+    fmt = None
+    pos = 12
+    while pos + 8 <= len(view):
+        chunk_id = bytes(view[pos:pos + 4])
+        (size,) = struct.unpack_from("<I", view, pos + 4)
+        body = pos + 8
+        if chunk_id == b"fmt " and size >= 16:
+            tag, channels, rate, _, _, bits = struct.unpack_from("<HHIIHH", view, body)
+            if tag != 1 or bits // 8 not in _WAV_FORMATS:
+                return None
+            fmt = (rate, _WAV_FORMATS[bits // 8], channels)
+        elif chunk_id == b"data" and fmt is not None:
+            return fmt, view[body:body + size]
+        pos = body + size + (size & 1)  # chunks are word aligned
+    return None
+
+
+def collect(assets_dir: str) -> List[str]:
+    """Pack names for every shippable asset under assets/"""
+    names = []
+    for folder in PACKED_DIRS:
+        folder_path = os.path.join(assets_dir, folder)
+        if not os.path.isdir(folder_path):
+            continue
+        for filename in sorted(os.listdir(folder_path)):
+            if filename.lower().endswith(PACKED_EXTENSIONS):
+                names.append(f"{folder}/{filename}")
+    return names
+
+
+def build(assets_dir: str, output: str, names: Iterable[str]) -> Dict[str, Tuple[int, int]]:
+    """Write a pack holding the named files; returns the index"""
+    index = {}
+    blobs = []
+    offset = 0
+    for name in names:
+        with open(os.path.join(assets_dir, name), "rb") as f:
+            data = f.read()
+        index[name] = (offset, len(data))
+        blobs.append(data)
+        offset += len(data)
+
+    header = json.dumps(index, separators=(",", ":")).encode("utf-8")
+    tmp_path = output + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, len(header)))
+        f.write(header)
+        for data in blobs:
+            f.write(data)
+    os.replace(tmp_path, output)
+    return index
+
+
+def main():
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    assets_dir = os.path.join(root, "assets")
+
+    parser = argparse.ArgumentParser(description="Build the single-file asset pack")
+    parser.add_argument("--output", default=os.path.join(assets_dir, "assets.pak"))
+    args = parser.parse_args()
+
+    index = build(assets_dir, args.output, collect(assets_dir))
+    total = sum(length for _, length in index.values())
+    print(f"Packed {len(index)} assets ({total / 1024:.0f} KiB) into {args.output}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
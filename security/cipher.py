@@ -0,0 +1,129 @@
+"""
+Process-wide encryption service.
+
+Keys are loaded once and the cipher is reused for every call, instead of
+re-reading data/secret.key and building a new Fernet per message. Keys
+come from, in order: a provider passed to CipherService, the
+BATO_BOMBER_KEYS environment variable, or the key file. Several keys
+(newest first, one per line in the file or comma separated in the
+variable) form a MultiFernet: data is encrypted with the first and can be
+decrypted with any, so old files stay readable after rotate_key_file().
+"""
+
+import os
+import threading
+from typing import BinaryIO, Callable, List, Optional, Sequence
+
+from core.paths import project_root
+
+DATA_DIR = os.path.join(project_root(), "data")
+KEY_FILE = os.path.join(DATA_DIR, "secret.key")
+KEY_ENV_VAR = "BATO_BOMBER_KEYS"
+STREAM_CHUNK_SIZE = 64 * 1024
+
+
+def generate_key() -> bytes:
+    from cryptography.fernet import Fernet  # Deferred: slow to import at startup
+    return Fernet.generate_key()
+
+
+def read_key_file() -> List[bytes]:
+    """Keys in the key file, newest first; creates the file with a new key if missing"""
+    if not os.path.exists(KEY_FILE):
+        key = generate_key()
+        os.makedirs(DATA_DIR, exist_ok=True)
+        with open(KEY_FILE, "wb") as key_file:
+            key_file.write(key)
+        return [key]
+    with open(KEY_FILE, "rb") as key_file:
+        return [line.strip() for line in key_file.read().splitlines() if line.strip()]
+
+
+def default_keys() -> List[bytes]:
+    """Keys from the environment if set, else from the key file"""
+    env_keys = os.environ.get(KEY_ENV_VAR)
+    if env_keys:
+        return [key.strip().encode("ascii") for key in env_keys.split(",") if key.strip()]
+    return read_key_file()
+
+
+def rotate_key_file() -> bytes:
+    """Put a new primary key at the front of the key file, keeping the old ones for decryption"""
+    keys = [generate_key()] + read_key_file()
+    tmp_path = KEY_FILE + ".tmp"
+    with open(tmp_path, "wb") as key_file:
+        key_file.write(b"\n".join(keys))
+    os.replace(tmp_path, KEY_FILE)
+    CipherService.reset()
+    return keys[0]
+
+
+class CipherService:
+    """Loads the keys once and shares one cipher between all callers"""
+
+    _default: Optional["CipherService"] = None
+    _default_lock = threading.Lock()
+
+    def __init__(self, key_provider: Optional[Callable[[], Sequence[bytes]]] = None):
+        self._key_provider = key_provider or default_keys
+        self._cipher = None
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def default() -> "CipherService":
+        """The service used by security.encryption"""
+        with CipherService._default_lock:
+            if CipherService._default is None:
+                CipherService._default = CipherService()
+            return CipherService._default
+
+    @staticmethod
+    def install(service: "CipherService"):
+        """Replace the default service, e.g. with CipherService(lambda: [key]) for in-memory keys"""
+        with CipherService._default_lock:
+            CipherService._default = service
+
+    @staticmethod
+    def reset():
+        """Drop the default service so the next call reloads the keys"""
+        with CipherService._default_lock:
+            CipherService._default = None
+
+    @property
+    def cipher(self):
+        if self._cipher is None:
+            with self._lock:
+                if self._cipher is None:
+                    from cryptography.fernet import Fernet, MultiFernet
+                    keys = list(self._key_provider())
+                    if not keys:
+                        raise ValueError("No encryption keys available")
+                    self._cipher = MultiFernet([Fernet(key) for key in keys])
+        return self._cipher
+
+    def encrypt(self, data: bytes) -> bytes:
+        return self.cipher.encrypt(data)
+
+    def decrypt(self, token: bytes) -> bytes:
+        """Decrypt with whichever key matches; raises cryptography's InvalidToken"""
+        return self.cipher.decrypt(token)
+
+    def rotate(self, token: bytes) -> bytes:
+        """Re-encrypt a token under the primary key"""
+        return self.cipher.rotate(token)
+
+    def encrypt_stream(self, source: BinaryIO, target: BinaryIO, chunk_size: int = STREAM_CHUNK_SIZE):
+        """Encrypt a stream chunk by chunk, one token per line, without holding it all in memory"""
+        while True:
+            chunk = source.read(chunk_size)
+            if not chunk:
+                break
+            target.write(self.cipher.encrypt(chunk))
+            target.write(b"\n")
+
+    def decrypt_stream(self, source: BinaryIO, target: BinaryIO):
+        """Decrypt a stream written by encrypt_stream"""
+        for line in source:
+            line = line.strip()
+            if line:
+                target.write(self.cipher.decrypt(line))
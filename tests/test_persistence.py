@@ -0,0 +1,40 @@
+import threading
+
+from core.persistence import PersistenceWorker
+
+
+def test_keyed_tasks_coalesce():
+    worker = PersistenceWorker()
+    release = threading.Event()
+    ran = []
+    worker.submit(release.wait)  # Hold the thread so the rest stay queued
+    worker.submit(lambda: ran.append("settings v1"), key="settings")
+    worker.submit(lambda: ran.append("score"))
+    worker.submit(lambda: ran.append("settings v2"), key="settings")
+    release.set()
+
+    assert worker.flush(timeout=5)
+    # The replacement keeps the first submission's place in the queue
+    assert ran == ["settings v2", "score"]
+    assert worker.shutdown()
+
+
+def test_failures_dispatch_on_caller_thread():
+    worker = PersistenceWorker()
+    failures = []
+    worker.events.subscribe("persistence_failed",
+                            lambda data: failures.append((data, threading.current_thread())))
+
+    def fail():
+        raise OSError("disk full")
+
+    worker.submit(fail, key="settings")
+    worker.submit(fail)
+    assert worker.flush(timeout=5)
+    assert failures == []  # Held until the game loop asks for them
+
+    worker.dispatch_events()
+    assert [data["key"] for data, _ in failures] == ["settings", None]
+    assert all(isinstance(data["error"], OSError) for data, _ in failures)
+    assert all(thread is threading.current_thread() for _, thread in failures)
+    assert worker.shutdown()
@@ -0,0 +1,92 @@
+import base64
+import os
+
+import pytest
+
+from gameplay.leaderboard import _score_key
+from gameplay.score_journal import ScoreJournal
+
+
+class FakeCipher:
+    """Stands in for CipherService: reversible, and rejects torn tokens"""
+
+    def encrypt(self, data: bytes) -> bytes:
+        return base64.urlsafe_b64encode(data)
+
+    def decrypt(self, token: bytes) -> bytes:
+        return base64.urlsafe_b64decode(token)
+
+
+def _record(name: str, score: int) -> dict:
+    return {"name": name, "score": score, "level": 1, "difficulty": "NORMAL", "date": ""}
+
+
+@pytest.fixture
+def journal(tmp_path):
+    return ScoreJournal(str(tmp_path / "data" / "leaderboard.journal"), cipher=FakeCipher())
+
+
+def test_round_trip(journal):
+    records = [_record("A", 10), _record("B", 30), _record("C", 20)]
+    for record in records:
+        journal.append(record)
+
+    assert list(journal.records()) == records
+    assert journal.record_count == 3
+    assert [r["name"] for r in journal.top(2, _score_key)] == ["B", "C"]
+
+
+def test_missing_journal_reads_empty(journal):
+    assert list(journal.records()) == []
+    assert journal.record_count == 0
+
+
+def test_unreadable_journal_raises(journal):
+    os.makedirs(journal.path)  # A directory where the file should be
+    with pytest.raises(OSError):
+        journal.records()
+
+
+def test_torn_line_is_skipped(journal):
+    journal.append(_record("A", 10))
+    with open(journal.path, "ab") as f:
+        f.write(journal.cipher.encrypt(b'{"name": "torn", "score": 99}')[:-6])  # Crash mid-write
+    journal.append(_record("B", 20))
+
+    assert [r["name"] for r in journal.records()] == ["A", "B"]
+
+
+def test_compaction_keeps_concurrent_append(journal, monkeypatch):
+    for i in range(5):
+        journal.append(_record(f"P{i}", i * 10))
+
+    decode = journal._decode_lines
+
+    def decode_during_append(lines):
+        # Lands after the compaction's snapshot and before its swap
+        journal.append(_record("late", 1))
+        return decode(lines)
+
+    monkeypatch.setattr(journal, "_decode_lines", decode_during_append)
+    journal.compact(2, _score_key)
+    monkeypatch.undo()
+
+    assert [r["name"] for r in journal.records()] == ["P4", "P3", "late"]
+    assert journal.record_count == 3
+
+
+def test_rewrite_beats_compaction(journal, monkeypatch):
+    for i in range(5):
+        journal.append(_record(f"P{i}", i * 10))
+
+    decode = journal._decode_lines
+
+    def decode_during_rewrite(lines):
+        journal.rewrite([_record("merged", 500)])
+        return decode(lines)
+
+    monkeypatch.setattr(journal, "_decode_lines", decode_during_rewrite)
+    journal.compact(2, _score_key)
+    monkeypatch.undo()
+
+    assert [r["name"] for r in journal.records()] == ["merged"]
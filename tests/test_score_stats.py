@@ -0,0 +1,58 @@
+import json
+import random
+
+import pytest
+
+from gameplay.score_stats import RunningStats, ScoreStats, bucket_bounds, bucket_index
+
+
+def _exact_percentile(scores, score):
+    return 100.0 * sum(1 for s in scores if s < score) / len(scores)
+
+
+def test_buckets_cover_their_scores():
+    for score in list(range(100)) + [1000, 12345, 2 ** 31 - 1]:
+        low, high = bucket_bounds(bucket_index(score))
+        assert low <= score < high
+
+
+def test_percentile_close_to_exact():
+    rng = random.Random(0)
+    scores = [int(rng.lognormvariate(8, 1.5)) for _ in range(20000)]
+    stats = RunningStats()
+    for score in scores:
+        stats.add(score)
+
+    ordered = sorted(scores)
+    for q in (0.01, 0.1, 0.25, 0.5, 0.75, 0.9, 0.99):
+        score = ordered[int(q * len(ordered))]
+        # Only the scores sharing this score's bucket are estimated
+        assert stats.percentile(score) == pytest.approx(_exact_percentile(scores, score), abs=0.5)
+
+    assert stats.mean == pytest.approx(sum(scores) / len(scores))
+
+
+def test_percentile_exact_for_small_scores():
+    stats = RunningStats()
+    for score in (1, 2, 2, 3, 5, 8, 13):
+        stats.add(score)
+    assert stats.percentile(5) == pytest.approx(100.0 * 4 / 7)
+    assert RunningStats().percentile(5) is None
+
+
+def test_groups_and_round_trip():
+    stats = ScoreStats("unused")
+    stats.add(100, "EASY", 1)
+    stats.add(300, "HARD", 2)
+    stats.add(200, "HARD", 1)
+
+    assert stats.group().count == 3
+    assert stats.group(difficulty="HARD").count == 2
+    assert stats.group(level=1).count == 2
+    assert stats.percentile(250, difficulty="HARD") == pytest.approx(50.0)
+    assert stats.percentile(100, difficulty="NIGHTMARE") is None
+
+    data = json.loads(stats.to_json())
+    restored = RunningStats.from_dict(data["overall"])
+    assert restored.buckets == stats.overall.buckets
+    assert restored.stddev == pytest.approx(stats.overall.stddev)
@@ -0,0 +1,21 @@
+from gameplay.leaderboard import ScoreEntry
+from gameplay.score_store import ScoreStore
+
+
+def _entries(*scores):
+    return [ScoreEntry(f"P{i}", score, 1, "NORMAL") for i, score in enumerate(scores)]
+
+
+def test_migrate_imports_once(tmp_path):
+    path = str(tmp_path / "data" / "scores.db")
+    store = ScoreStore(path)
+    assert store.migrate(_entries(10, 20, 30))
+    assert not store.migrate(_entries(40))
+    assert store.count() == 3
+    store.close()
+
+    # The marker is in the database, so a later launch doesn't import again
+    store = ScoreStore(path)
+    assert not store.migrate(_entries(50))
+    assert [e.score for e in store.top(5)] == [30, 20, 10]
+    store.close()
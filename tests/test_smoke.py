@@ -0,0 +1,27 @@
+import os
+
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+import pytest
+
+
+@pytest.fixture
+def mixer():
+    pygame.init()
+    pygame.mixer.init()
+    yield
+    pygame.mixer.quit()
+    pygame.quit()
+
+
+def test_sound_manager_constructs(mixer):
+    """main() builds a SoundManager at startup; its reserved channels must all exist"""
+    from core.sound import SoundManager
+
+    manager = SoundManager()
+    assert pygame.mixer.get_num_channels() >= manager.voices.end_channel + 2
+    manager.play_sfx("explosion")
+    manager.play_background_music(0.5)
+    manager.stop_background_music()